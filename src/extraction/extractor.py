@@ -2,7 +2,7 @@
 import logging
 import re
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, Iterable, List, Tuple
 
 from .models import Signal, ExtractionError
 from .patterns import PatternMatcher
@@ -11,6 +11,73 @@ from .validators import SignalValidator
 
 logger = logging.getLogger(__name__)
 
+# "now" in a signal marks a market order
+_NOW_RE = re.compile(r'\bnow\b', re.IGNORECASE)
+
+_PRICE = r'(\d+(?:\.\d+)?)'
+
+# Exact message layouts of channels with a stable format. A message that
+# matches one yields the same fields the full pattern set would
+_NICK_ALPHA_RE = re.compile(
+    rf'GOLD (BUY|SELL)\n\nGold (buy|sell) now @{_PRICE}-{_PRICE}\n\n'
+    rf'sl: ?{_PRICE}\n\ntp1: ?{_PRICE}\ntp2: ?{_PRICE}',
+    re.ASCII,
+)
+_GARY_GOLD_RE = re.compile(
+    rf'GARY GOLD LEGACY\nGold (Buy|Sell) Now @ ?{_PRICE}-{_PRICE}\n'
+    rf'sl: ?{_PRICE}\ntp1: ?{_PRICE}\ntp2: ?{_PRICE}',
+    re.ASCII,
+)
+
+
+def _parse_nick_alpha(text: str) -> Optional[tuple]:
+    """
+    Parse a Nick Alpha Trader signal in its standard layout
+
+    Args:
+        text: Message text
+
+    Returns:
+        Tuple of (raw_symbol, direction, entry_single, entry_min, entry_max,
+        stop_loss, take_profits), or None if the message doesn't follow the layout
+    """
+    match = _NICK_ALPHA_RE.fullmatch(text)
+    if match is None:
+        return None
+    direction, body_direction, price1, price2, stop_loss, tp1, tp2 = match.groups()
+    if body_direction.upper() != direction:
+        return None
+    price1, price2 = float(price1), float(price2)
+    return ('GOLD', direction, None, min(price1, price2), max(price1, price2),
+            float(stop_loss), [float(tp1), float(tp2)])
+
+
+def _parse_gary_gold(text: str) -> Optional[tuple]:
+    """
+    Parse a Gary Gold Legacy signal in its standard layout
+
+    Args:
+        text: Message text
+
+    Returns:
+        Tuple of (raw_symbol, direction, entry_single, entry_min, entry_max,
+        stop_loss, take_profits), or None if the message doesn't follow the layout
+    """
+    match = _GARY_GOLD_RE.fullmatch(text)
+    if match is None:
+        return None
+    direction, price1, price2, stop_loss, tp1, tp2 = match.groups()
+    price1, price2 = float(price1), float(price2)
+    return ('GOLD', direction.upper(), None, min(price1, price2), max(price1, price2),
+            float(stop_loss), [float(tp1), float(tp2)])
+
+
+# Specialised parsers by lowercased channel username
+CHANNEL_PARSERS: Dict[str, Callable[[str], Optional[tuple]]] = {
+    'nickalphatrader': _parse_nick_alpha,
+    'garygoldlegacy': _parse_gary_gold,
+}
+
 
 class SignalExtractor:
     """Extracts trading signals from text messages"""
@@ -80,70 +147,32 @@ class SignalExtractor:
         """
         logger.debug(f"Extracting signal from message {message_id} (@{channel_username})")
 
-        # Extract all fields
-        extracted_fields = {}
-
-        # Symbol
-        symbol = self.pattern_matcher.extract_symbol(text)
-        extracted_fields['symbol'] = symbol
-
-        # Direction
-        direction = self.pattern_matcher.extract_direction(text)
-        extracted_fields['direction'] = direction
-
-        # Entry
-        entry_single, entry_min, entry_max = self.pattern_matcher.extract_entry(text)
-        extracted_fields['entry_price'] = entry_single
-        extracted_fields['entry_price_min'] = entry_min
-        extracted_fields['entry_price_max'] = entry_max
+        # Known channel formats have a specialised parser; anything else, or a
+        # message that strays from the channel's format, uses every pattern
+        parser = CHANNEL_PARSERS.get(channel_username.lower()) if channel_username else None
+        parsed = parser(text) if parser is not None else None
+        if parsed is not None:
+            symbol, direction, entry_single, entry_min, entry_max, stop_loss, take_profits = parsed
+            symbol = self.pattern_matcher._normalize_symbol(symbol)
+            sl_pips = None
+        else:
+            (symbol, direction, entry_single, entry_min, entry_max,
+             stop_loss, sl_pips, take_profits) = self._extract_fields(text)
 
         # Mark as market order if "now" keyword found, or if no entry price extracted
         has_explicit_entry = entry_single is not None or (entry_min is not None and entry_max is not None)
-        is_market_order = bool(re.search(r'\bnow\b', text, re.IGNORECASE)) or not has_explicit_entry
-        extracted_fields['is_market_order'] = is_market_order
-
-        # Stop Loss - try pips format first, then absolute values
-        stop_loss = None
-        sl_pips = self.pattern_matcher.extract_stop_loss_pips(text)
-        if sl_pips:
-            # Calculate SL price from pips
-            entry_ref = entry_single or ((entry_min + entry_max) / 2 if entry_min and entry_max else None)
-            if entry_ref and direction:
-                stop_loss = self._calculate_sl_from_pips(entry_ref, direction, sl_pips, symbol)
-                logger.debug(f"Calculated SL from pips: {stop_loss} ({sl_pips} pips)")
-        else:
-            # Try absolute SL value
-            stop_loss = self.pattern_matcher.extract_stop_loss(text)
-
-        extracted_fields['stop_loss'] = stop_loss
-        extracted_fields['sl_pips'] = sl_pips
-
-        # Take Profits - try pips formats first, then absolute values
-        take_profits = []
-        entry_ref = entry_single or ((entry_min + entry_max) / 2 if entry_min and entry_max else None)
-
-        # Try numbered pips format first (tp1 3pips, tp2 4pips, etc.)
-        tp_pips_numbered = self.pattern_matcher.extract_take_profits_pips_numbered(text)
-        if tp_pips_numbered and entry_ref and direction:
-            # Calculate TP prices from numbered pips list
-            take_profits = self._calculate_tp_from_pips_list(
-                entry_ref, direction, tp_pips_numbered, symbol
-            )
-            logger.debug(f"Calculated TPs from numbered pips: {take_profits} ({tp_pips_numbered})")
-        else:
-            # Try range pips format (TP 30-100pips)
-            tp_pips = self.pattern_matcher.extract_take_profits_pips(text)
-            if tp_pips:
-                # Calculate TP prices from pips range
-                if entry_ref and direction:
-                    take_profits = self._calculate_tp_from_pips(
-                        entry_ref, direction, tp_pips, symbol
-                    )
-                    logger.debug(f"Calculated TPs from pips: {take_profits} ({tp_pips} pips)")
-            else:
-                # Try absolute TP values
-                tp_list = self.pattern_matcher.extract_take_profits(text)
-                take_profits = [tp_price for _, tp_price in tp_list]
+        is_market_order = bool(_NOW_RE.search(text)) or not has_explicit_entry
+
+        extracted_fields = {
+            'symbol': symbol,
+            'direction': direction,
+            'entry_price': entry_single,
+            'entry_price_min': entry_min,
+            'entry_price_max': entry_max,
+            'is_market_order': is_market_order,
+            'stop_loss': stop_loss,
+            'sl_pips': sl_pips,
+        }
 
         # Resolve truncated prices (e.g., "90" instead of "5190")
         entry_single, entry_min, entry_max, stop_loss, take_profits = self._resolve_truncated_prices(
@@ -250,6 +279,93 @@ class SignalExtractor:
 
         return signal
 
+    def _extract_fields(self, text: str) -> tuple:
+        """
+        Extract the raw signal fields using the full pattern set
+
+        Args:
+            text: Message text
+
+        Returns:
+            Tuple of (symbol, direction, entry_single, entry_min, entry_max,
+            stop_loss, sl_pips, take_profits)
+        """
+        # Symbol
+        symbol = self.pattern_matcher.extract_symbol(text)
+
+        # Direction
+        direction = self.pattern_matcher.extract_direction(text)
+
+        # Entry
+        entry_single, entry_min, entry_max = self.pattern_matcher.extract_entry(text)
+
+        # Stop Loss - try pips format first, then absolute values
+        stop_loss = None
+        sl_pips = self.pattern_matcher.extract_stop_loss_pips(text)
+        if sl_pips:
+            # Calculate SL price from pips
+            entry_ref = entry_single or ((entry_min + entry_max) / 2 if entry_min and entry_max else None)
+            if entry_ref and direction:
+                stop_loss = self._calculate_sl_from_pips(entry_ref, direction, sl_pips, symbol)
+                logger.debug(f"Calculated SL from pips: {stop_loss} ({sl_pips} pips)")
+        else:
+            # Try absolute SL value
+            stop_loss = self.pattern_matcher.extract_stop_loss(text)
+
+        # Take Profits - try pips formats first, then absolute values
+        take_profits = []
+        entry_ref = entry_single or ((entry_min + entry_max) / 2 if entry_min and entry_max else None)
+
+        # Try numbered pips format first (tp1 3pips, tp2 4pips, etc.)
+        tp_pips_numbered = self.pattern_matcher.extract_take_profits_pips_numbered(text)
+        if tp_pips_numbered and entry_ref and direction:
+            # Calculate TP prices from numbered pips list
+            take_profits = self._calculate_tp_from_pips_list(
+                entry_ref, direction, tp_pips_numbered, symbol
+            )
+            logger.debug(f"Calculated TPs from numbered pips: {take_profits} ({tp_pips_numbered})")
+        else:
+            # Try range pips format (TP 30-100pips)
+            tp_pips = self.pattern_matcher.extract_take_profits_pips(text)
+            if tp_pips:
+                # Calculate TP prices from pips range
+                if entry_ref and direction:
+                    take_profits = self._calculate_tp_from_pips(
+                        entry_ref, direction, tp_pips, symbol
+                    )
+                    logger.debug(f"Calculated TPs from pips: {take_profits} ({tp_pips} pips)")
+            else:
+                # Try absolute TP values
+                tp_list = self.pattern_matcher.extract_take_profits(text)
+                take_profits = [tp_price for _, tp_price in tp_list]
+
+        return symbol, direction, entry_single, entry_min, entry_max, stop_loss, sl_pips, take_profits
+
+    def extract_many(
+        self,
+        items: Iterable[Tuple[str, int, str, datetime]]
+    ) -> List[Optional[Signal]]:
+        """
+        Extract signals from a batch of messages
+
+        Args:
+            items: (text, message_id, channel_username, timestamp) tuples
+
+        Returns:
+            One entry per item, in order: the extracted Signal, or None if
+            extraction failed for that message
+        """
+        extract = self.extract_signal
+        signals = []
+        append = signals.append
+        for text, message_id, channel_username, timestamp in items:
+            try:
+                append(extract(text, message_id, channel_username, timestamp))
+            except ValueError as e:
+                logger.debug("Extraction failed for message %s: %s", message_id, e)
+                append(None)
+        return signals
+
     def _get_pip_value(self, symbol: str) -> float:
         """
         Get pip value for a symbol
@@ -1,7 +1,20 @@
 """Pattern matching for signal extraction using regex"""
 import re
 import logging
-from typing import List, Optional, Tuple, Dict
+import threading
+from typing import List, Optional, Set, Tuple, Dict
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
 
 
 logger = logging.getLogger(__name__)
@@ -147,6 +160,221 @@ UNIFIED_PATTERNS = {
 }
 
 
+# RE2 and Hyperscan have no lookaround; patterns using it stay on the re engine
+_RE2_UNSUPPORTED = ('(?=', '(?!', '(?<=', '(?<!')
+
+
+def _to_ascii_syntax(pattern: str, for_re2: bool = False) -> str:
+    """
+    Rewrite a pattern for an ASCII-only engine, keeping its meaning on ASCII text
+
+    Unicode-mode re counts \\x1c-\\x1f as whitespace, which re.ASCII's \\s
+    does not; RE2's \\s also lacks \\v, and RE2 spells code points
+    \\x{XXXX} rather than \\uXXXX.
+    """
+    extra_space = r'\x0b\x1c-\x1f' if for_re2 else r'\x1c-\x1f'
+    out = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\' and i + 1 < len(pattern):
+            escaped = pattern[i + 1]
+            if escaped == 's':
+                out.append(rf'\s{extra_space}' if in_class else rf'[\s{extra_space}]')
+                i += 2
+                continue
+            if escaped == 'u' and for_re2:
+                out.append(f'\\x{{{pattern[i + 2:i + 6]}}}')
+                i += 6
+                continue
+            out.append(pattern[i:i + 2])
+            i += 2
+            continue
+        if char == '[' and not in_class:
+            in_class = True
+        elif char == ']' and in_class:
+            in_class = False
+        out.append(char)
+        i += 1
+    return ''.join(out)
+
+
+def _lowercase_literals(pattern: str) -> str:
+    """Lowercase a pattern's literals, leaving escapes such as \\W and \\S intact"""
+    out = []
+    i = 0
+    while i < len(pattern):
+        if pattern[i] == '\\':
+            out.append(pattern[i:i + 2])
+            i += 2
+            continue
+        out.append(pattern[i].lower())
+        i += 1
+    return ''.join(out)
+
+
+# Last text lowercased, so a message is lowercased once for all its patterns
+_last_lowered = ('', '')
+
+
+def _lower(text: str) -> str:
+    """Return text.lower(), reusing the result for repeated calls on one string"""
+    global _last_lowered
+    cached = _last_lowered
+    if cached[0] is text:
+        return cached[1]
+    lowered = text.lower()
+    _last_lowered = (text, lowered)
+    return lowered
+
+
+class _DualPattern:
+    """
+    A pattern compiled for ASCII text and for Unicode text
+
+    Most messages are plain ASCII (the str.isascii() check is O(1)); they
+    run on RE2, which matches in linear time, or on an re.ASCII build,
+    which skips Unicode category lookups. A lowered re.ASCII build matches
+    case-sensitively against the lowercased text, so no case folding is
+    done per character. Anything else runs on the Unicode re pattern so
+    Unicode digits, spaces and word boundaries keep their meaning.
+    """
+
+    __slots__ = ('_ascii', '_unicode', '_lowered')
+
+    def __init__(self, ascii_pattern, unicode_pattern, lowered: bool = False):
+        self._ascii = ascii_pattern
+        self._unicode = unicode_pattern
+        self._lowered = lowered
+
+    def search(self, text: str):
+        if not text.isascii():
+            return self._unicode.search(text)
+        return self._ascii.search(_lower(text) if self._lowered else text)
+
+    def finditer(self, text: str):
+        if not text.isascii():
+            return self._unicode.finditer(text)
+        return self._ascii.finditer(_lower(text) if self._lowered else text)
+
+
+def _compile(pattern: str, keep_case: bool = False) -> _DualPattern:
+    """
+    Compile a case-insensitive pattern for ASCII and Unicode text
+
+    The ASCII side uses google-re2 when it is installed and the pattern has
+    no lookaround, and an re.ASCII build otherwise.
+
+    Args:
+        pattern: Regex source
+        keep_case: Captured text must keep its original case, so the
+            pattern can't run on lowercased text
+    """
+    compiled = re.compile(pattern, re.IGNORECASE)
+    if RE2_AVAILABLE and not any(op in pattern for op in _RE2_UNSUPPORTED):
+        try:
+            return _DualPattern(re2.compile('(?i)' + _to_ascii_syntax(pattern, for_re2=True)), compiled)
+        except re2.error:
+            pass
+    if keep_case:
+        return _DualPattern(re.compile(_to_ascii_syntax(pattern), re.IGNORECASE | re.ASCII), compiled)
+    return _DualPattern(
+        re.compile(_lowercase_literals(_to_ascii_syntax(pattern)), re.ASCII), compiled, lowered=True
+    )
+
+
+# Compiled once at import so PatternMatcher methods only pay for matching
+# Symbol captures are looked up in symbol_mapping, so they keep their case
+_COMPILED_PATTERNS = {
+    name: [_compile(pattern, keep_case=(name == 'symbol')) for pattern in patterns]
+    for name, patterns in UNIFIED_PATTERNS.items()
+}
+
+# Message-type families checked for every incoming message
+_FLAG_NAMES = ('close_signal', 'break_even', 'tp_hit', 'partial_close')
+
+# Message-type families only ask whether *any* of their patterns matches, so
+# each family is fused into one alternation and checked in a single scan.
+# 'symbol' is fused the same way to rule out symbol-free text in one pass.
+_FLAG_PATTERNS = {
+    # '(?!)' never matches, for a family with no patterns
+    name: _compile(
+        '|'.join(f'(?:{pattern})' for pattern in UNIFIED_PATTERNS.get(name, [])) or '(?!)'
+    )
+    for name in _FLAG_NAMES + ('symbol',)
+}
+
+# A close signal must also mention one of these
+_CLOSE_KEYWORDS = ('close', 'exit', 'book profit', 'ready for next')
+
+
+def _build_flag_database():
+    """
+    Compile every message-type pattern into one Hyperscan database
+
+    Each expression's id is the index of its family in _FLAG_NAMES. The
+    database is only used for ASCII text, where the RE2 syntax rewrite keeps
+    the patterns' meaning.
+
+    Returns:
+        hyperscan.Database, or None if hyperscan is unavailable or a pattern
+        can't be compiled
+    """
+    if not HYPERSCAN_AVAILABLE:
+        return None
+
+    expressions = []
+    ids = []
+    for family_id, name in enumerate(_FLAG_NAMES):
+        for pattern in UNIFIED_PATTERNS.get(name, []):
+            if any(op in pattern for op in _RE2_UNSUPPORTED):
+                return None
+            expressions.append(_to_ascii_syntax(pattern, for_re2=True).encode('ascii'))
+            ids.append(family_id)
+    if not expressions:
+        return None
+
+    database = hyperscan.Database()
+    try:
+        database.compile(
+            expressions=expressions,
+            ids=ids,
+            elements=len(expressions),
+            flags=hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_SINGLEMATCH,
+        )
+    except hyperscan.error as e:
+        logger.warning(f"Hyperscan could not compile message-type patterns, using re: {e}")
+        return None
+    return database
+
+
+_FLAG_DATABASE = _build_flag_database()
+
+# Hyperscan scratch space can't be shared between concurrent scans
+_scratch_local = threading.local()
+
+
+def _flag_scratch():
+    """Return this thread's Hyperscan scratch space for _FLAG_DATABASE"""
+    scratch = getattr(_scratch_local, 'scratch', None)
+    if scratch is None:
+        scratch = _scratch_local.scratch = hyperscan.Scratch(_FLAG_DATABASE)
+    return scratch
+
+
+def _on_flag_match(family_id, start, end, flags, found):
+    """Hyperscan match callback: record the matching family"""
+    found.add(family_id)
+
+# Every direction pattern captures a BUY/SELL word that this generic pattern
+# also matches, so one scan with it finds all candidate directions
+_DIRECTION_WORD_RE = _COMPILED_PATTERNS['direction'][-1]
+
+_CLOSE_BUY_RE = _compile(r'\bclose\s+buy\b')
+_CLOSE_SELL_RE = _compile(r'\bclose\s+sell\b')
+
+
 class PatternMatcher:
     """Pattern matching for signal extraction"""
 
@@ -194,8 +422,10 @@ class PatternMatcher:
         Returns:
             Normalized symbol or None
         """
-        for pattern in UNIFIED_PATTERNS['symbol']:
-            match = re.search(pattern, text, re.IGNORECASE)
+        if _FLAG_PATTERNS['symbol'].search(text) is None:
+            return None
+        for pattern in _COMPILED_PATTERNS['symbol']:
+            match = pattern.search(text)
             if match:
                 symbol = match.group(1)
                 # Normalize symbol
@@ -229,8 +459,16 @@ class PatternMatcher:
         Returns:
             "BUY" or "SELL" or None
         """
-        for pattern in UNIFIED_PATTERNS['direction']:
-            match = re.search(pattern, text, re.IGNORECASE)
+        words = {match.group(1).upper() for match in _DIRECTION_WORD_RE.finditer(text)}
+        if not words:
+            return None
+        if len(words) == 1:
+            # Only one direction word appears, so pattern priority can't change the answer
+            direction = words.pop()
+            logger.debug(f"Extracted direction: {direction}")
+            return direction
+        for pattern in _COMPILED_PATTERNS['direction']:
+            match = pattern.search(text)
             if match:
                 direction = match.group(1).upper()
                 logger.debug(f"Extracted direction: {direction}")
@@ -250,8 +488,8 @@ class PatternMatcher:
             - For range entry: (None, min, max)
         """
         # Try range format first
-        for pattern in UNIFIED_PATTERNS['entry_range']:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _COMPILED_PATTERNS['entry_range']:
+            match = pattern.search(text)
             if match:
                 price1 = float(match.group(1))
                 price2 = float(match.group(2))
@@ -264,8 +502,8 @@ class PatternMatcher:
                 return (None, entry_min, entry_max)
 
         # Try single entry
-        for pattern in UNIFIED_PATTERNS['entry_single']:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _COMPILED_PATTERNS['entry_single']:
+            match = pattern.search(text)
             if match:
                 entry_price = float(match.group(1))
                 logger.debug(f"Extracted single entry: {entry_price}")
@@ -284,16 +522,16 @@ class PatternMatcher:
             Stop loss price or None
         """
         # Try standard SL patterns first
-        for pattern in UNIFIED_PATTERNS['stop_loss']:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _COMPILED_PATTERNS['stop_loss']:
+            match = pattern.search(text)
             if match:
                 sl = float(match.group(1))
                 logger.debug(f"Extracted stop loss: {sl}")
                 return sl
 
         # Try numbered SL patterns (stop1:, SL1:, etc.)
-        for pattern in UNIFIED_PATTERNS['stop_loss_numbered']:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _COMPILED_PATTERNS['stop_loss_numbered']:
+            match = pattern.search(text)
             if match:
                 sl = float(match.group(2))  # group(1) is the number, group(2) is the price
                 logger.debug(f"Extracted stop loss: {sl} (from numbered pattern)")
@@ -314,8 +552,8 @@ class PatternMatcher:
         tps = []
 
         # Try numbered TP patterns first (tp1:, tp2:, T1:, target1:)
-        for pattern in UNIFIED_PATTERNS['take_profit']:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for pattern in _COMPILED_PATTERNS['take_profit']:
+            matches = pattern.finditer(text)
             for match in matches:
                 tp_num = _to_int(match.group(1))
                 tp_price = float(match.group(2))
@@ -325,8 +563,8 @@ class PatternMatcher:
         # If no numbered TPs found, try single TP patterns (tp:, target:, TP. price)
         # Each pattern is tried; break on first pattern that yields matches
         if not tps:
-            for pattern in UNIFIED_PATTERNS['take_profit_single']:
-                found = list(re.finditer(pattern, text, re.IGNORECASE))
+            for pattern in _COMPILED_PATTERNS['take_profit_single']:
+                found = list(pattern.finditer(text))
                 if found:
                     for i, match in enumerate(found, start=1):
                         tp_price = float(match.group(1))
@@ -350,8 +588,8 @@ class PatternMatcher:
             Tuple of (min_pips, max_pips) or (pips, None) for single value, or None
         """
         # Try range format first: "TP 30-100pips"
-        for pattern in UNIFIED_PATTERNS['take_profit_pips']:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _COMPILED_PATTERNS['take_profit_pips']:
+            match = pattern.search(text)
             if match:
                 if match.lastindex == 2:
                     # Range format
@@ -378,8 +616,8 @@ class PatternMatcher:
         """
         tps = []
 
-        for pattern in UNIFIED_PATTERNS['take_profit_pips_numbered']:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
+        for pattern in _COMPILED_PATTERNS['take_profit_pips_numbered']:
+            matches = pattern.finditer(text)
             for match in matches:
                 tp_num = _to_int(match.group(1))
                 tp_pips = int(match.group(2))
@@ -401,8 +639,8 @@ class PatternMatcher:
         Returns:
             Stop loss in pips or None
         """
-        for pattern in UNIFIED_PATTERNS['stop_loss_pips']:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _COMPILED_PATTERNS['stop_loss_pips']:
+            match = pattern.search(text)
             if match:
                 pips = int(match.group(1))
                 logger.debug(f"Extracted SL pips: {pips}")
@@ -411,42 +649,64 @@ class PatternMatcher:
 
     def is_close_signal(self, text: str) -> bool:
         """Check if message is a close/exit signal."""
-        text_lower = text.lower()
         # Must contain a close-related keyword
-        close_keywords = ['close', 'exit', 'book profit', 'ready for next']
-        if not any(kw in text_lower for kw in close_keywords):
+        if not self._has_close_keyword(text):
             return False
-        for pattern in UNIFIED_PATTERNS.get('close_signal', []):
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        return False
+        return _FLAG_PATTERNS['close_signal'].search(text) is not None
+
+    @staticmethod
+    def _has_close_keyword(text: str) -> bool:
+        """Check for a close-related keyword, required of close signals"""
+        text_lower = text.lower()
+        return any(kw in text_lower for kw in _CLOSE_KEYWORDS)
 
     def is_break_even_signal(self, text: str) -> bool:
         """Check if message is a break-even signal."""
-        for pattern in UNIFIED_PATTERNS.get('break_even', []):
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        return False
+        return _FLAG_PATTERNS['break_even'].search(text) is not None
 
     def is_tp_hit_signal(self, text: str) -> bool:
         """Check if message indicates a take profit was hit."""
-        for pattern in UNIFIED_PATTERNS.get('tp_hit', []):
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        return False
+        return _FLAG_PATTERNS['tp_hit'].search(text) is not None
 
     def is_partial_close_signal(self, text: str) -> bool:
         """Check if message is a partial close signal (close some, hold rest)."""
-        for pattern in UNIFIED_PATTERNS.get('partial_close', []):
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        return False
+        return _FLAG_PATTERNS['partial_close'].search(text) is not None
+
+    def message_flags(self, text: str) -> Set[str]:
+        """
+        Check all message-type families at once
+
+        For ASCII text with hyperscan installed this is a single scan over the
+        message; otherwise each family's fused pattern is searched in turn.
+
+        Args:
+            text: Message text
+
+        Returns:
+            The matching families, from 'close_signal', 'break_even', 'tp_hit'
+            and 'partial_close', with the same results as the is_* checks
+        """
+        if _FLAG_DATABASE is not None and text.isascii():
+            found = set()
+            _FLAG_DATABASE.scan(
+                text.encode('ascii'),
+                match_event_handler=_on_flag_match,
+                context=found,
+                scratch=_flag_scratch(),
+            )
+            flags = {_FLAG_NAMES[family_id] for family_id in found}
+        else:
+            flags = {name for name in _FLAG_NAMES if _FLAG_PATTERNS[name].search(text) is not None}
+
+        if 'close_signal' in flags and not self._has_close_keyword(text):
+            flags.discard('close_signal')
+        return flags
 
     def extract_close_direction(self, text: str) -> Optional[str]:
         """Extract if close is for a specific direction (BUY/SELL) or all."""
-        if re.search(r'\bclose\s+buy\b', text, re.IGNORECASE):
+        if _CLOSE_BUY_RE.search(text):
             return 'BUY'
-        if re.search(r'\bclose\s+sell\b', text, re.IGNORECASE):
+        if _CLOSE_SELL_RE.search(text):
             return 'SELL'
         return None  # Close all directions
 
@@ -5,9 +5,82 @@ from typing import List, Tuple, Optional
 
 from .models import Signal
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 
 logger = logging.getLogger(__name__)
 
+# Direction codes used by the batch price-logic kernel
+_DIRECTION_CODES = {'BUY': 1, 'SELL': -1}
+
+
+def _price_logic_kernel(entries, stop_losses, directions, take_profits, tp_offsets, valid):
+    """
+    Batch form of SignalValidator._validate_price_logic
+
+    Signal i has entry entries[i] (NaN if unknown), stop loss stop_losses[i]
+    (NaN if unset), direction code directions[i] and take profits
+    take_profits[tp_offsets[i]:tp_offsets[i + 1]]. valid[i] is set to False
+    where _validate_price_logic would raise.
+    """
+    for i in range(entries.shape[0]):
+        entry = entries[i]
+        ok = True
+        if not math.isnan(entry):
+            direction = directions[i]
+            stop_loss = stop_losses[i]
+            if direction == 1 and stop_loss >= entry:
+                ok = False
+            elif direction == -1 and stop_loss <= entry:
+                ok = False
+            for j in range(tp_offsets[i], tp_offsets[i + 1]):
+                tp = take_profits[j]
+                if (direction == 1 and tp <= entry) or (direction == -1 and tp >= entry):
+                    ok = False
+                    break
+        valid[i] = ok
+
+
+if NUMBA_AVAILABLE:
+    _price_logic_kernel = njit(_price_logic_kernel)
+
+
+def _run_price_logic_kernel(signals: List[Signal]) -> List[bool]:
+    """Pack signals into arrays and run _price_logic_kernel over them (needs numpy)"""
+    count = len(signals)
+    nan = math.nan
+    entries = np.empty(count)
+    stop_losses = np.empty(count)
+    directions = np.empty(count, dtype=np.int8)
+    tp_offsets = np.empty(count + 1, dtype=np.int64)
+    tp_offsets[0] = 0
+    take_profits = []
+    for i, signal in enumerate(signals):
+        entry = signal.get_entry_average()
+        entries[i] = nan if entry is None else entry
+        # A falsy stop loss is skipped, as in _validate_price_logic
+        stop_losses[i] = signal.stop_loss if signal.stop_loss else nan
+        directions[i] = _DIRECTION_CODES.get(signal.direction, 0)
+        take_profits.extend(signal.take_profits)
+        tp_offsets[i + 1] = len(take_profits)
+
+    valid = np.empty(count, dtype=np.bool_)
+    _price_logic_kernel(
+        entries, stop_losses, directions,
+        np.asarray(take_profits, dtype=np.float64), tp_offsets, valid
+    )
+    return valid.tolist()
+
 
 class SignalValidator:
     """Validates extracted trading signals"""
@@ -56,6 +129,32 @@ class SignalValidator:
         logger.debug(f"Signal validation passed for {signal.symbol} {signal.direction}")
         return True
 
+    def validate_batch(self, signals: List[Signal]) -> List[bool]:
+        """
+        Check stop loss and take profit placement for many signals at once
+
+        Runs the same checks as _validate_price_logic, in a compiled loop
+        over packed arrays when numba is installed.
+
+        Args:
+            signals: Signals to check
+
+        Returns:
+            One flag per signal, False where SL or a TP is on the wrong side
+            of the entry for the signal's direction
+        """
+        if not NUMBA_AVAILABLE:
+            return [self._price_logic_ok(signal) for signal in signals]
+        return _run_price_logic_kernel(signals)
+
+    def _price_logic_ok(self, signal: Signal) -> bool:
+        """Return whether a signal passes _validate_price_logic"""
+        try:
+            self._validate_price_logic(signal)
+        except ValueError:
+            return False
+        return True
+
     def _validate_required_fields(self, signal: Signal):
         """Validate that required fields are present"""
         if not signal.symbol:
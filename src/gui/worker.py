@@ -142,6 +142,12 @@ class BackgroundWorker(QThread):
             if self.mt5_executor:
                 self.mt5_executor.disconnect()
 
+            if self.csv_writer:
+                self.csv_writer.close()
+
+            if self.error_logger:
+                self.error_logger.close()
+
             if self.telegram_client:
                 await self.telegram_client.disconnect()
 
@@ -226,10 +232,11 @@ class BackgroundWorker(QThread):
             self.message_received.emit(channel_username, preview)
 
             # Check for close/break-even/partial-close signals first
-            is_close = self.signal_extractor.pattern_matcher.is_close_signal(message_text)
-            is_be = self.signal_extractor.pattern_matcher.is_break_even_signal(message_text)
-            is_tp_hit = self.signal_extractor.pattern_matcher.is_tp_hit_signal(message_text)
-            is_partial = self.signal_extractor.pattern_matcher.is_partial_close_signal(message_text)
+            flags = self.signal_extractor.pattern_matcher.message_flags(message_text)
+            is_close = 'close_signal' in flags
+            is_be = 'break_even' in flags
+            is_tp_hit = 'tp_hit' in flags
+            is_partial = 'partial_close' in flags
 
             if is_close or is_be or is_tp_hit or is_partial:
                 close_dir = self.signal_extractor.pattern_matcher.extract_close_direction(message_text)
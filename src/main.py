@@ -277,15 +277,18 @@ class SignalExtractorApp:
                 self.logger.error("No enabled channels configured!")
                 return
 
+            channel_usernames = []
             for channel in enabled_channels:
                 channel_username = channel.get('username')
                 if channel_username:
                     self.telegram_client.add_channel(channel_username)
+                    channel_usernames.append(channel_username)
 
-                    # Test channel access
-                    can_access = await self.telegram_client.test_channel_access(channel_username)
-                    if not can_access:
-                        self.logger.warning(f"Cannot access channel: @{channel_username}")
+            # Test channel access (lookups run concurrently)
+            access = await self.telegram_client.test_channels_access(channel_usernames)
+            for channel_username, can_access in access.items():
+                if not can_access:
+                    self.logger.warning(f"Cannot access channel: @{channel_username}")
 
             # Fetch historical messages on startup
             startup_fetch_hours = self.config.get('telegram.startup_fetch_hours', 24)
@@ -1,17 +1,100 @@
 """HTTP Server for MT5 EA signal delivery"""
 import json
+import queue
+import sys
 import threading
+import time
 from datetime import datetime, timezone
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from email.utils import formatdate
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
 from typing import Optional
 
 from .signal_store import SignalStore
 
 
+# Fixed response headers, terminated by the blank line that precedes the body
+_JSON_HEADERS = (
+    b"Content-Type: application/json\r\n"
+    b"Access-Control-Allow-Origin: *\r\n"
+    b"\r\n"
+)
+
+# Largest POST body drained; ack requests carry none
+_MAX_BODY_BYTES = 64 * 1024
+
+# [epoch second, ISO string, ISO bytes, HTTP Date header line] - response timestamps
+# only change once a second
+_NOW_CACHE = [0, "", b"", b""]
+
+
+def _refresh_now_cache() -> None:
+    """Rebuild the cached timestamps if the wall-clock second has moved on"""
+    second = int(time.time())
+    if second != _NOW_CACHE[0]:
+        iso = datetime.fromtimestamp(second, timezone.utc).isoformat()
+        date_line = b"Date: " + formatdate(second, usegmt=True).encode("latin-1") + b"\r\n"
+        # Publish the values before the key so readers never pair a new key with old values
+        _NOW_CACHE[1], _NOW_CACHE[2], _NOW_CACHE[3] = iso, iso.encode(), date_line
+        _NOW_CACHE[0] = second
+
+
+def _utc_now_iso() -> tuple:
+    """Get current UTC time as (str, bytes) ISO-8601, rebuilt at most once per second"""
+    _refresh_now_cache()
+    return _NOW_CACHE[1], _NOW_CACHE[2]
+
+
+def _http_date_line() -> bytes:
+    """Get the ``Date:`` response header line, rebuilt at most once per second"""
+    _refresh_now_cache()
+    return _NOW_CACHE[3]
+
+
+# Request log lines are handed to a background printer so request threads never
+# wait on the stdout lock; when the queue is full, lines are dropped
+_LOG_QUEUE: "queue.Queue[str]" = queue.Queue(maxsize=1024)
+_log_thread: Optional[threading.Thread] = None
+_log_thread_lock = threading.Lock()
+
+
+def _log_loop():
+    """Drain queued request log lines and print them in batches"""
+    while True:
+        batch = [_LOG_QUEUE.get()]
+        try:
+            while len(batch) < 256:
+                batch.append(_LOG_QUEUE.get_nowait())
+        except queue.Empty:
+            pass
+        sys.stdout.write("".join(f"[SignalServer] {line}\n" for line in batch))
+        sys.stdout.flush()
+
+
+def _queue_log(line: str):
+    """Queue a request log line, starting the printer thread on first use"""
+    global _log_thread
+    if _log_thread is None:
+        with _log_thread_lock:
+            if _log_thread is None:
+                _log_thread = threading.Thread(
+                    target=_log_loop, name="SignalServerLog", daemon=True
+                )
+                _log_thread.start()
+    try:
+        _LOG_QUEUE.put_nowait(line)
+    except queue.Full:
+        pass
+
+
 class SignalRequestHandler(BaseHTTPRequestHandler):
     """HTTP request handler for signal endpoints"""
 
+    # Keep-alive so polling EAs reuse one TCP connection
+    protocol_version = "HTTP/1.1"
+    # Close idle keep-alive connections rather than parking a thread on them
+    timeout = 30
+
     # Class-level references (set by server)
     signal_store: Optional[SignalStore] = None
     mt5_executor = None  # Optional MT5Executor reference
@@ -38,6 +121,24 @@ class SignalRequestHandler(BaseHTTPRequestHandler):
         parsed = urlparse(self.path)
         path = parsed.path
 
+        # Drain any request body so it isn't parsed as the next request on this connection
+        try:
+            content_length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            content_length = -1
+        if content_length < 0:
+            # The body can't be delimited, so the rest of the stream is unusable
+            self.close_connection = True
+            self._send_error(400, "Invalid Content-Length")
+            return
+        if content_length > _MAX_BODY_BYTES:
+            # Don't park this thread reading an oversized (or never-arriving) body
+            self.close_connection = True
+            self._send_error(413, "Request body too large")
+            return
+        if content_length > 0:
+            self.rfile.read(content_length)
+
         # POST /signals/<message_id>/ack
         if path.startswith("/signals/") and path.endswith("/ack"):
             message_id = path.split("/")[2]
@@ -64,13 +165,26 @@ class SignalRequestHandler(BaseHTTPRequestHandler):
                 self._send_error(400, f"Invalid 'since' format. Use ISO format (e.g., 2026-02-06T10:00:00Z)")
                 return
 
+        last_update, last_update_bytes = _utc_now_iso()
+
+        if since is None:
+            # Common EA poll: reuse the store's serialized payload
+            signals_json, count = self.signal_store.get_pending_signals_serialized(symbol)
+            body = (
+                b'{"signals":' + signals_json
+                + b',"count":' + str(count).encode()
+                + b',"last_update":"' + last_update_bytes + b'"}'
+            )
+            self._send_bytes(body)
+            return
+
         # Get pending signals
         signals = self.signal_store.get_pending_signals(symbol=symbol, since=since)
 
         response = {
             "signals": signals,
             "count": len(signals),
-            "last_update": datetime.now(timezone.utc).isoformat(),
+            "last_update": last_update,
         }
 
         self._send_json(response)
@@ -95,7 +209,7 @@ class SignalRequestHandler(BaseHTTPRequestHandler):
         """Handle GET /health"""
         self._send_json({
             "status": "healthy",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _utc_now_iso()[0],
         })
 
     def _handle_stats(self):
@@ -132,22 +246,34 @@ class SignalRequestHandler(BaseHTTPRequestHandler):
         })
 
     def _send_json(self, data: dict, status: int = 200):
-        """Send JSON response"""
-        self.send_response(status)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Access-Control-Allow-Origin", "*")
-        self.end_headers()
-
-        response = json.dumps(data, indent=2)
-        self.wfile.write(response.encode('utf-8'))
+        """Send JSON response (compact, matching the serialized /signals payload)"""
+        response = json.dumps(data, separators=(",", ":"))
+        self._send_bytes(response.encode('utf-8'), status)
+
+    def _send_bytes(self, body: bytes, status: int = 200):
+        """Send an already-serialized JSON body, headers and body in a single write"""
+        reason = self.responses.get(status, ("",))[0]
+        head = (
+            f"{self.protocol_version} {status} {reason}\r\n"
+            f"Server: {self.version_string()}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+        ).encode("latin-1") + _http_date_line()
+        if not getattr(self.server, "running", True):
+            # The owning SignalServer is stopping: end this keep-alive session
+            self.close_connection = True
+        if self.close_connection:
+            head += b"Connection: close\r\n"
+
+        self.log_request(status, len(body))
+        self.wfile.write(head + _JSON_HEADERS + body)
 
     def _send_error(self, status: int, message: str):
         """Send error response"""
         self._send_json({"error": message}, status)
 
     def log_message(self, format, *args):
-        """Override to customize logging"""
-        print(f"[SignalServer] {args[0]}")
+        """Override to customize logging (printed from a background thread)"""
+        _queue_log(str(args[0]))
 
 
 class SignalServer:
@@ -178,7 +304,7 @@ class SignalServer:
         self.signal_store = signal_store
         self.host = host
         self.port = port
-        self._server: Optional[HTTPServer] = None
+        self._server: Optional[ThreadingHTTPServer] = None
         self._thread: Optional[threading.Thread] = None
         self._running = False
 
@@ -194,8 +320,10 @@ class SignalServer:
         # Set store on handler class
         SignalRequestHandler.signal_store = self.signal_store
 
-        # Create server
-        self._server = HTTPServer((self.host, self.port), SignalRequestHandler)
+        # Create server (one thread per request so concurrent EA polls don't queue)
+        self._server = ThreadingHTTPServer((self.host, self.port), SignalRequestHandler)
+        # Read by handlers so keep-alive sessions close once stop() is called
+        self._server.running = True
         self._running = True
 
         # Run in background thread
@@ -219,7 +347,10 @@ class SignalServer:
         self._running = False
 
         if self._server:
+            self._server.running = False
             self._server.shutdown()
+            # Release the listening socket so start() can bind the port again
+            self._server.server_close()
             self._server = None
 
         if self._thread:
@@ -3,12 +3,39 @@ import json
 import threading
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Union
-from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, field, asdict, replace
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from ..extraction.models import Signal
 
 
+def _dumps(obj) -> bytes:
+    """Serialize to compact UTF-8 JSON, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(data: bytes):
+    """Parse UTF-8 JSON bytes, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _parse_time(value: Union[float, str]) -> datetime:
+    """Parse a persisted store time: epoch seconds, or ISO string from older files"""
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value)
+    return datetime.fromisoformat(value)
+
+
 @dataclass
 class StoredSignal:
     """Signal with status tracking for MT5"""
@@ -16,12 +43,22 @@ class StoredSignal:
     status: str = "pending"  # pending, acknowledged, expired
     created_at: datetime = field(default_factory=datetime.now)
     acknowledged_at: Optional[datetime] = None
+    # MT5 response dict and its JSON encoding, built once when the signal enters the store
+    mt5_dict: Optional[dict] = field(default=None, repr=False, compare=False)
+    mt5_json_bytes: bytes = field(default=b"", repr=False, compare=False)
 
 
 class SignalStore:
     """
     Thread-safe in-memory signal store with persistence.
 
+    Reads are lock-free: writers build a new dict under ``_write_lock`` and
+    swap the ``_signals`` reference as a whole, so readers only ever see a
+    complete snapshot. StoredSignal entries are never mutated after they are
+    published; state changes replace the entry instead. Persisting to disk
+    happens after the write lock is released, so file I/O never blocks other
+    writers.
+
     Signals flow:
     1. New signal extracted -> add_signal() -> status: pending
     2. EA fetches signal -> get_pending_signals() -> returns pending signals
@@ -37,14 +74,27 @@ class SignalStore:
             persistence_path: Path to JSON file for persistence (optional)
             max_age_hours: Maximum age of signals before cleanup
         """
+        # Replaced wholesale on every write (copy-on-write); never mutated in place
         self._signals: Dict[str, StoredSignal] = {}
-        self._lock = threading.RLock()
+        # Pending-only indexes so EA polls cost O(matches) instead of O(store)
+        self._pending_all: Dict[str, StoredSignal] = {}
+        self._pending_by_symbol: Dict[str, Dict[str, StoredSignal]] = {}
+        self._ack_count = 0
+        # Serialized /signals payloads keyed by symbol (None = unfiltered);
+        # swapped for an empty dict on every mutation
+        self._response_cache: Dict[Optional[str], Tuple[bytes, int]] = {}
+        self._write_lock = threading.Lock()
+        # Bumped on every published change; lets _persist skip snapshots already saved
+        self._version = 0
+        self._persisted_version = 0
+        self._persist_lock = threading.Lock()
         self._persistence_path = Path(persistence_path) if persistence_path else None
         self._max_age = timedelta(hours=max_age_hours)
 
         # Load persisted signals on startup
         if self._persistence_path:
             self._load_from_file()
+            self._rebuild_indexes()
 
     def add_signal(self, signal: Signal) -> bool:
         """
@@ -58,14 +108,32 @@ class SignalStore:
         """
         message_id = str(signal.message_id)
 
-        with self._lock:
-            # Check for duplicate
-            if message_id in self._signals:
+        # Lock-free duplicate check against the current snapshot, so repeats
+        # are rejected without contending for the write lock
+        if message_id in self._signals:
+            return False
+
+        # Serialize outside the lock; only the publish needs to be serialized
+        stored = self._new_stored_signal(signal)
+
+        with self._write_lock:
+            signals = self._signals
+            # Re-check: another writer may have added it since the snapshot read
+            if message_id in signals:
                 return False
 
-            self._signals[message_id] = StoredSignal(signal=signal)
-            self._persist()
-            return True
+            self._signals = {**signals, message_id: stored}
+
+            symbol = signal.symbol
+            self._pending_by_symbol = {
+                **self._pending_by_symbol,
+                symbol: {**self._pending_by_symbol.get(symbol, {}), message_id: stored},
+            }
+            self._pending_all = {**self._pending_all, message_id: stored}
+            self._mark_changed()
+
+        self._persist()
+        return True
 
     def get_pending_signals(
         self,
@@ -80,34 +148,51 @@ class SignalStore:
             since: Only return signals received after this datetime
 
         Returns:
-            List of signal dictionaries for JSON response
+            List of signal dictionaries for JSON response (shared with the
+            store; callers must not mutate them)
         """
-        with self._lock:
-            results = []
-
-            for stored in self._signals.values():
-                if stored.status != "pending":
+        results = []
+
+        for stored in self._pending_candidates(symbol).values():
+            # Filter by since datetime
+            if since:
+                signal_time = stored.signal.timestamp or stored.created_at
+                # Handle timezone comparison
+                if signal_time.tzinfo is None and since.tzinfo is not None:
+                    signal_time = signal_time.replace(tzinfo=timezone.utc)
+                elif signal_time.tzinfo is not None and since.tzinfo is None:
+                    since = since.replace(tzinfo=timezone.utc)
+                if signal_time < since:
                     continue
 
-                if symbol and stored.signal.symbol != symbol:
-                    continue
+            results.append(stored.mt5_dict)
 
-                # Filter by since datetime
-                if since:
-                    signal_time = stored.signal.timestamp or stored.created_at
-                    # Handle timezone comparison
-                    if signal_time.tzinfo is None and since.tzinfo is not None:
-                        signal_time = signal_time.replace(tzinfo=timezone.utc)
-                    elif signal_time.tzinfo is not None and since.tzinfo is None:
-                        since = since.replace(tzinfo=timezone.utc)
-                    if signal_time < since:
-                        continue
+        return results
 
-                # Convert to dict format for MT5
-                signal_dict = self._signal_to_mt5_dict(stored.signal)
-                results.append(signal_dict)
+    def get_pending_signals_serialized(self, symbol: Optional[str] = None) -> Tuple[bytes, int]:
+        """
+        Get pending signals as a serialized JSON array, cached until the next mutation.
 
-            return results
+        Args:
+            symbol: Filter by trading symbol (e.g., "XAUUSD")
+
+        Returns:
+            Tuple of (JSON array bytes, number of signals)
+        """
+        symbol = symbol or None
+        # Grab the cache before reading the indexes: writers publish the
+        # indexes first, so a fresh cache never gets filled from stale data
+        cache = self._response_cache
+        entry = cache.get(symbol)
+        if entry is None:
+            # Splice the per-signal JSON encoded at insert time
+            pending = self._pending_candidates(symbol)
+            body = b"[" + b",".join(s.mt5_json_bytes for s in pending.values()) + b"]"
+            entry = (body, len(pending))
+            # Unknown symbols are cheap to answer and would let clients grow the cache
+            if symbol is None or symbol in self._pending_by_symbol:
+                cache[symbol] = entry
+        return entry
 
     def acknowledge_signal(self, message_id: str) -> bool:
         """
@@ -119,21 +204,37 @@ class SignalStore:
         Returns:
             True if acknowledged, False if not found
         """
-        with self._lock:
-            if message_id not in self._signals:
+        with self._write_lock:
+            stored = self._signals.get(message_id)
+            if stored is None:
                 return False
 
-            self._signals[message_id].status = "acknowledged"
-            self._signals[message_id].acknowledged_at = datetime.now()
-            self._persist()
-            return True
+            acked = replace(stored, status="acknowledged", acknowledged_at=datetime.now())
+            self._signals = {**self._signals, message_id: acked}
+
+            if stored.status == "pending":
+                symbol = stored.signal.symbol
+                bucket = {**self._pending_by_symbol.get(symbol, {})}
+                bucket.pop(message_id, None)
+                by_symbol = {**self._pending_by_symbol, symbol: bucket}
+                if not bucket:
+                    del by_symbol[symbol]
+                self._pending_by_symbol = by_symbol
+
+                pending_all = {**self._pending_all}
+                pending_all.pop(message_id, None)
+                self._pending_all = pending_all
+            if stored.status != "acknowledged":
+                self._ack_count += 1
+            self._mark_changed()
+
+        self._persist()
+        return True
 
     def get_signal_status(self, message_id: str) -> Optional[str]:
         """Get status of a signal"""
-        with self._lock:
-            if message_id in self._signals:
-                return self._signals[message_id].status
-            return None
+        stored = self._signals.get(message_id)
+        return stored.status if stored is not None else None
 
     def cleanup_old_signals(self) -> int:
         """
@@ -142,34 +243,31 @@ class SignalStore:
         Returns:
             Number of signals removed
         """
-        with self._lock:
+        with self._write_lock:
             now = datetime.now()
-            to_remove = []
-
-            for msg_id, stored in self._signals.items():
-                age = now - stored.created_at
-                if age > self._max_age:
-                    to_remove.append(msg_id)
+            kept = {
+                msg_id: stored for msg_id, stored in self._signals.items()
+                if now - stored.created_at <= self._max_age
+            }
+            removed = len(self._signals) - len(kept)
 
-            for msg_id in to_remove:
-                del self._signals[msg_id]
+            if removed:
+                self._signals = kept
+                self._rebuild_indexes()
+                self._mark_changed()
 
-            if to_remove:
-                self._persist()
+        if removed:
+            self._persist()
 
-            return len(to_remove)
+        return removed
 
     def get_stats(self) -> dict:
         """Get store statistics"""
-        with self._lock:
-            pending = sum(1 for s in self._signals.values() if s.status == "pending")
-            acknowledged = sum(1 for s in self._signals.values() if s.status == "acknowledged")
-
-            return {
-                "total": len(self._signals),
-                "pending": pending,
-                "acknowledged": acknowledged,
-            }
+        return {
+            "total": len(self._signals),
+            "pending": len(self._pending_all),
+            "acknowledged": self._ack_count,
+        }
 
     def get_all_message_ids(self) -> set:
         """
@@ -178,8 +276,45 @@ class SignalStore:
         Returns:
             Set of message IDs (as integers)
         """
-        with self._lock:
-            return {int(msg_id) for msg_id in self._signals.keys()}
+        return {int(msg_id) for msg_id in self._signals.keys()}
+
+    def _mark_changed(self):
+        """Invalidate cached responses after publishing a change (call under _write_lock)"""
+        self._response_cache = {}
+        self._version += 1
+
+    def _pending_candidates(self, symbol: Optional[str]) -> Dict[str, StoredSignal]:
+        """Get the pending index for a symbol, or all pending signals"""
+        if symbol:
+            return self._pending_by_symbol.get(symbol, {})
+        return self._pending_all
+
+    def _new_stored_signal(self, signal: Signal, **kwargs) -> StoredSignal:
+        """Wrap a signal with its precomputed MT5 dict and JSON encoding"""
+        mt5_dict = self._signal_to_mt5_dict(signal)
+        return StoredSignal(
+            signal=signal,
+            mt5_dict=mt5_dict,
+            mt5_json_bytes=_dumps(mt5_dict),
+            **kwargs
+        )
+
+    def _rebuild_indexes(self):
+        """Recompute pending indexes and counters from the current snapshot"""
+        pending_all = {}
+        by_symbol: Dict[str, Dict[str, StoredSignal]] = {}
+        ack_count = 0
+
+        for msg_id, stored in self._signals.items():
+            if stored.status == "pending":
+                pending_all[msg_id] = stored
+                by_symbol.setdefault(stored.signal.symbol, {})[msg_id] = stored
+            elif stored.status == "acknowledged":
+                ack_count += 1
+
+        self._pending_by_symbol = by_symbol
+        self._pending_all = pending_all
+        self._ack_count = ack_count
 
     def _signal_to_mt5_dict(self, signal: Signal) -> dict:
         """Convert Signal to MT5-compatible dictionary"""
@@ -198,31 +333,47 @@ class SignalStore:
         }
 
     def _persist(self):
-        """Save signals to file"""
+        """
+        Save the latest snapshot to file.
+
+        Always writes the current snapshot rather than the caller's, so when
+        concurrent writers finish out of order the file still ends up with the
+        newest state, and a writer whose change was already saved skips the I/O.
+        """
         if not self._persistence_path:
             return
 
-        try:
-            data = {
-                "version": 1,
-                "updated_at": datetime.now().isoformat(),
-                "signals": {}
-            }
+        with self._persist_lock:
+            # Read the version before the snapshot: the snapshot is then at least that new
+            version = self._version
+            if version == self._persisted_version:
+                return
+            signals = self._signals
 
-            for msg_id, stored in self._signals.items():
-                data["signals"][msg_id] = {
-                    "signal": stored.signal.to_dict(),
-                    "status": stored.status,
-                    "created_at": stored.created_at.isoformat(),
-                    "acknowledged_at": stored.acknowledged_at.isoformat() if stored.acknowledged_at else None,
+            try:
+                data = {
+                    "version": 1,
+                    "updated_at": datetime.now().isoformat(),
+                    "signals": {}
                 }
 
-            self._persistence_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self._persistence_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+                for msg_id, stored in signals.items():
+                    data["signals"][msg_id] = {
+                        "signal": stored.signal.to_dict(),
+                        "status": stored.status,
+                        # Epoch seconds load much faster than ISO strings on startup
+                        "created_at": stored.created_at.timestamp(),
+                        "acknowledged_at": stored.acknowledged_at.timestamp() if stored.acknowledged_at else None,
+                    }
 
-        except Exception as e:
-            print(f"Warning: Failed to persist signals: {e}")
+                self._persistence_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self._persistence_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2)
+
+                self._persisted_version = version
+
+            except Exception as e:
+                print(f"Warning: Failed to persist signals: {e}")
 
     def _load_from_file(self):
         """Load signals from file"""
@@ -230,13 +381,19 @@ class SignalStore:
             return
 
         try:
-            with open(self._persistence_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _loads(self._persistence_path.read_bytes())
 
             if data.get("version") != 1:
                 return
 
+            now = datetime.now()
+            signals = {}
             for msg_id, stored_data in data.get("signals", {}).items():
+                # Only load non-expired signals; skip rebuilding the ones we would drop
+                created_at = _parse_time(stored_data["created_at"])
+                if now - created_at >= self._max_age:
+                    continue
+
                 signal_dict = stored_data["signal"]
 
                 # Reconstruct Signal object
@@ -266,16 +423,15 @@ class SignalStore:
                     extracted_at=datetime.fromisoformat(signal_dict["extracted_at"]) if signal_dict.get("extracted_at") else datetime.now(),
                 )
 
-                stored = StoredSignal(
-                    signal=signal,
+                stored = self._new_stored_signal(
+                    signal,
                     status=stored_data["status"],
-                    created_at=datetime.fromisoformat(stored_data["created_at"]),
-                    acknowledged_at=datetime.fromisoformat(stored_data["acknowledged_at"]) if stored_data.get("acknowledged_at") else None,
+                    created_at=created_at,
+                    acknowledged_at=_parse_time(stored_data["acknowledged_at"]) if stored_data.get("acknowledged_at") else None,
                 )
+                signals[msg_id] = stored
 
-                # Only load non-expired signals
-                if datetime.now() - stored.created_at < self._max_age:
-                    self._signals[msg_id] = stored
+            self._signals = signals
 
         except Exception as e:
             print(f"Warning: Failed to load persisted signals: {e}")
@@ -1,10 +1,15 @@
 """CSV writer for signal output"""
+import atexit
 import csv
 import logging
+import operator
+import os
+import threading
+import time
+from collections import deque
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 from datetime import datetime, timedelta, timezone
-import pandas as pd
 
 from ..extraction.models import Signal
 
@@ -13,7 +18,17 @@ logger = logging.getLogger(__name__)
 
 
 class CSVWriter:
-    """Writes signals to CSV file"""
+    """
+    Writes signals to CSV file
+
+    Rows are queued in memory and appended in batches by a background
+    flusher thread (every FLUSH_INTERVAL seconds, or sooner once
+    FLUSH_BATCH_SIZE rows are waiting). Reads and rewrites flush first, so
+    callers always see their own writes. A failed background flush is
+    raised from the next write_signal()/write_signals() call until a flush
+    succeeds. Call close() (also registered with atexit) to flush what is
+    left on shutdown.
+    """
 
     # CSV field order (optimized for MT5 consumption - no raw message)
     FIELD_NAMES = [
@@ -35,6 +50,31 @@ class CSVWriter:
         'extracted_at',
     ]
 
+    # Plain Signal attributes that map 1:1 onto CSV columns, pulled in one C call
+    _PRICE_GETTER = operator.attrgetter(
+        'symbol', 'direction', 'entry_price', 'entry_price_min',
+        'entry_price_max', 'stop_loss',
+    )
+
+    # Columns converted back to numbers when reading rows
+    _INT_FIELDS = frozenset({'message_id'})
+    _FLOAT_FIELDS = frozenset({
+        'entry_price', 'entry_price_min', 'entry_price_max', 'stop_loss',
+        'take_profit_1', 'take_profit_2', 'take_profit_3', 'take_profit_4',
+        'confidence_score',
+    })
+
+    # read_signals(limit=N) reads only the file tail when the file is larger
+    # than TAIL_READ_THRESHOLD, starting TAIL_BYTES_PER_ROW * N bytes from the end
+    TAIL_READ_THRESHOLD = 1 << 20
+    TAIL_BYTES_PER_ROW = 512
+
+    # Background flush policy
+    FLUSH_INTERVAL = 0.5  # seconds
+    FLUSH_BATCH_SIZE = 64
+    # Minimum seconds between repeated log lines while flushes keep failing
+    ERROR_LOG_INTERVAL = 60.0
+
     def __init__(self, file_path: Path, encoding: str = 'utf-8'):
         """
         Initialize CSV writer
@@ -46,6 +86,17 @@ class CSVWriter:
         self.file_path = Path(file_path)
         self.encoding = encoding
 
+        # Pending rows and flusher state (thread starts on first write)
+        self._queue: deque = deque()
+        self._flush_lock = threading.RLock()
+        self._wake = threading.Event()
+        self._flush_thread = None
+        self._closed = False
+
+        # Last flush failure (cleared by the next successful flush) and when it was logged
+        self._flush_error: Optional[Exception] = None
+        self._error_logged_at = 0.0
+
         # Ensure parent directory exists
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -58,66 +109,169 @@ class CSVWriter:
         """Ensure CSV file exists with proper header"""
         if not self.file_path.exists():
             with open(self.file_path, 'w', newline='', encoding=self.encoding) as f:
-                writer = csv.DictWriter(f, fieldnames=self.FIELD_NAMES)
-                writer.writeheader()
+                csv.writer(f).writerow(self.FIELD_NAMES)
             logger.info(f"Created new CSV file with header: {self.file_path}")
 
     def write_signal(self, signal: Signal):
         """
-        Write a single signal to CSV
+        Queue a single signal for writing to CSV
 
         Args:
             signal: Signal to write
 
         Raises:
-            IOError: If write fails
+            IOError: If the writer has been closed, or the last flush failed
         """
-        try:
-            # Convert signal to dict and filter to only include FIELD_NAMES
-            signal_dict = signal.to_dict()
-            filtered_dict = {k: v for k, v in signal_dict.items() if k in self.FIELD_NAMES}
-
-            # Write to CSV
-            with open(self.file_path, 'a', newline='', encoding=self.encoding) as f:
-                writer = csv.DictWriter(f, fieldnames=self.FIELD_NAMES, extrasaction='ignore')
-                writer.writerow(filtered_dict)
+        self._enqueue([self._signal_row(signal)])
 
-            logger.info(
-                f"Wrote signal to CSV: {signal.symbol} {signal.direction} "
-                f"(message_id: {signal.message_id})"
-            )
-
-        except Exception as e:
-            logger.error(f"Failed to write signal to CSV: {e}", exc_info=True)
-            raise IOError(f"CSV write failed: {e}")
+        logger.info(
+            f"Queued signal for CSV: {signal.symbol} {signal.direction} "
+            f"(message_id: {signal.message_id})"
+        )
 
     def write_signals(self, signals: List[Signal]):
         """
-        Write multiple signals to CSV
+        Queue multiple signals for writing to CSV
 
         Args:
             signals: List of signals to write
 
         Raises:
-            IOError: If write fails
+            IOError: If the writer has been closed, or the last flush failed
         """
         if not signals:
             logger.warning("No signals to write")
             return
 
+        row = self._signal_row
+        self._enqueue([row(signal) for signal in signals])
+
+        logger.info(f"Queued {len(signals)} signals for CSV")
+
+    def flush(self) -> int:
+        """
+        Write all queued rows to the CSV file
+
+        Returns:
+            Number of rows written
+
+        Raises:
+            IOError: If write fails (rows stay queued for the next attempt)
+        """
+        with self._flush_lock:
+            batch = []
+            while self._queue:
+                batch.append(self._queue.popleft())
+
+            if not batch:
+                return 0
+
+            try:
+                with open(self.file_path, 'a', newline='', encoding=self.encoding,
+                          buffering=1 << 16) as f:
+                    csv.writer(f).writerows(batch)
+            except Exception as e:
+                # Put rows back in order so a transient failure (e.g. file
+                # locked by a spreadsheet) doesn't lose signals
+                self._queue.extendleft(reversed(batch))
+                self._record_flush_error(e)
+                raise IOError(f"CSV write failed: {e}") from e
+
+            if self._flush_error is not None:
+                logger.info("CSV writes recovered")
+                self._flush_error = None
+
+            logger.debug(f"Flushed {len(batch)} signal(s) to CSV")
+            return len(batch)
+
+    def close(self):
+        """Stop the background flusher and write any remaining rows"""
+        self._closed = True
+        self._wake.set()
+
+        thread = self._flush_thread
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout=5)
+
+        self._flush_quietly()
+        atexit.unregister(self.close)
+
+    def _record_flush_error(self, error: Exception):
+        """Remember a flush failure, logging it when new and then at most every ERROR_LOG_INTERVAL"""
+        now = time.monotonic()
+        if self._flush_error is None or now - self._error_logged_at >= self.ERROR_LOG_INTERVAL:
+            logger.error(f"Failed to write signals to CSV: {error}", exc_info=True)
+            self._error_logged_at = now
+        self._flush_error = error
+
+    def _flush_quietly(self):
+        """Flush queued rows, leaving them queued (and logged) on failure"""
         try:
-            with open(self.file_path, 'a', newline='', encoding=self.encoding) as f:
-                writer = csv.DictWriter(f, fieldnames=self.FIELD_NAMES, extrasaction='ignore')
-                for signal in signals:
-                    signal_dict = signal.to_dict()
-                    filtered_dict = {k: v for k, v in signal_dict.items() if k in self.FIELD_NAMES}
-                    writer.writerow(filtered_dict)
+            self.flush()
+        except IOError:
+            pass
+
+    @classmethod
+    def _signal_row(cls, signal: Signal) -> tuple:
+        """
+        Build a CSV row tuple in FIELD_NAMES order straight from the signal's
+        attributes, without going through Signal.to_dict()
 
-            logger.info(f"Wrote {len(signals)} signals to CSV")
+        Args:
+            signal: Signal to convert
 
-        except Exception as e:
-            logger.error(f"Failed to write signals to CSV: {e}", exc_info=True)
-            raise IOError(f"CSV batch write failed: {e}")
+        Returns:
+            Row tuple matching FIELD_NAMES
+        """
+        timestamp = signal.timestamp
+        created_at = signal.created_at
+        extracted_at = signal.extracted_at
+        tps = signal.take_profits
+        n_tps = len(tps)
+        if n_tps >= 4:
+            tp_cols = (tps[0], tps[1], tps[2], tps[3])
+        else:
+            tp_cols = tuple(tps) + (None,) * (4 - n_tps)
+
+        return (
+            (signal.message_id, signal.channel_username,
+             timestamp.isoformat() if timestamp else None)
+            + cls._PRICE_GETTER(signal)
+            + tp_cols
+            + (signal.confidence_score,
+               created_at.isoformat() if created_at else None,
+               extracted_at.isoformat() if extracted_at else None)
+        )
+
+    def _enqueue(self, rows: List[tuple]):
+        """Queue rows and make sure the flusher is running"""
+        if self._closed:
+            raise IOError("CSV writer is closed")
+
+        error = self._flush_error
+        if error is not None:
+            raise IOError(f"CSV write failed: {error}") from error
+
+        self._queue.extend(rows)
+
+        if self._flush_thread is None:
+            with self._flush_lock:
+                if self._flush_thread is None:
+                    self._flush_thread = threading.Thread(
+                        target=self._flush_loop, name="CSVWriterFlush", daemon=True
+                    )
+                    self._flush_thread.start()
+                    atexit.register(self.close)
+
+        if len(self._queue) >= self.FLUSH_BATCH_SIZE:
+            self._wake.set()
+
+    def _flush_loop(self):
+        """Background thread: flush on interval or when the batch fills up"""
+        while not self._closed:
+            self._wake.wait(self.FLUSH_INTERVAL)
+            self._wake.clear()
+            self._flush_quietly()
 
     def read_signals(self, limit: int = None) -> List[dict]:
         """
@@ -129,16 +283,22 @@ class CSVWriter:
         Returns:
             List of signal dictionaries
         """
+        self._flush_quietly()
+
         if not self.file_path.exists():
             return []
 
         try:
-            df = pd.read_csv(self.file_path, encoding=self.encoding)
-
             if limit:
-                df = df.tail(limit)
+                rows = self._read_tail_rows(limit)
+                if rows is None:
+                    with open(self.file_path, 'r', encoding=self.encoding, newline='') as f:
+                        rows = deque(csv.DictReader(f), maxlen=limit)
+            else:
+                with open(self.file_path, 'r', encoding=self.encoding, newline='') as f:
+                    rows = list(csv.DictReader(f))
 
-            return df.to_dict('records')
+            return [self._convert_row(row) for row in rows]
 
         except Exception as e:
             logger.error(f"Failed to read signals from CSV: {e}")
@@ -151,12 +311,29 @@ class CSVWriter:
         Returns:
             Signal count
         """
+        self._flush_quietly()
+
         if not self.file_path.exists():
             return 0
 
         try:
-            df = pd.read_csv(self.file_path, encoding=self.encoding)
-            return len(df)
+            # Count newlines in raw chunks; no need to parse rows just to count them
+            lines = 0
+            last_byte = b'\n'
+            with open(self.file_path, 'rb') as f:
+                while True:
+                    chunk = f.read(1 << 20)
+                    if not chunk:
+                        break
+                    lines += chunk.count(b'\n')
+                    last_byte = chunk[-1:]
+
+            # Unterminated final row still counts
+            if last_byte != b'\n':
+                lines += 1
+
+            # Exclude header
+            return max(lines - 1, 0)
         except Exception as e:
             logger.error(f"Failed to count signals: {e}")
             return 0
@@ -168,24 +345,82 @@ class CSVWriter:
         Returns:
             Set of message IDs (as integers)
         """
+        self._flush_quietly()
+
         if not self.file_path.exists():
             return set()
 
         try:
-            df = pd.read_csv(self.file_path, encoding=self.encoding)
-            if 'message_id' in df.columns:
-                return set(df['message_id'].dropna().astype(int).tolist())
-            return set()
+            with open(self.file_path, 'r', encoding=self.encoding, newline='') as f:
+                reader = csv.reader(f)
+                header = next(reader, None)
+                if not header or 'message_id' not in header:
+                    return set()
+
+                id_index = header.index('message_id')
+                ids = set()
+                for row in reader:
+                    if len(row) > id_index and row[id_index]:
+                        ids.add(int(float(row[id_index])))
+                return ids
         except Exception as e:
             logger.error(f"Failed to get existing message IDs: {e}")
             return set()
 
+    def _read_tail_rows(self, limit: int):
+        """
+        Parse only the last rows of a large CSV by seeking near the end.
+
+        Args:
+            limit: Number of rows wanted
+
+        Returns:
+            Up to `limit` row dicts, or None if the file is small or the tail
+            window did not hold enough rows (caller should read the whole file)
+        """
+        size = self.file_path.stat().st_size
+        start = size - limit * self.TAIL_BYTES_PER_ROW
+        if size <= self.TAIL_READ_THRESHOLD or start <= 0:
+            return None
+
+        with open(self.file_path, 'rb') as f:
+            header_line = f.readline()
+            f.seek(max(start, len(header_line)))
+            f.readline()  # skip the partial row we landed in
+            tail = f.read()
+
+        header = next(csv.reader([header_line.decode(self.encoding)]))
+        lines = tail.decode(self.encoding).splitlines()
+        rows = deque(csv.DictReader(lines, fieldnames=header), maxlen=limit)
+        return rows if len(rows) == limit else None
+
+    @classmethod
+    def _convert_row(cls, row: dict) -> dict:
+        """
+        Turn a raw CSV row into a signal dict: empty cells become None and
+        numeric columns are converted back to int/float.
+        """
+        for key, value in row.items():
+            if not value:
+                row[key] = None
+            elif key in cls._FLOAT_FIELDS:
+                try:
+                    row[key] = float(value)
+                except ValueError:
+                    pass
+            elif key in cls._INT_FIELDS:
+                try:
+                    row[key] = int(float(value))
+                except ValueError:
+                    pass
+        return row
+
     def clear(self):
         """Clear all signals from CSV (keeps header)"""
         try:
-            with open(self.file_path, 'w', newline='', encoding=self.encoding) as f:
-                writer = csv.DictWriter(f, fieldnames=self.FIELD_NAMES)
-                writer.writeheader()
+            with self._flush_lock, open(self.file_path, 'w', newline='', encoding=self.encoding) as f:
+                csv.writer(f).writerow(self.FIELD_NAMES)
+                self._queue.clear()
             logger.info("Cleared all signals from CSV")
         except Exception as e:
             logger.error(f"Failed to clear CSV: {e}")
@@ -201,47 +436,83 @@ class CSVWriter:
         Returns:
             Number of records removed
         """
-        if not self.file_path.exists():
-            return 0
-
-        try:
-            df = pd.read_csv(self.file_path, encoding=self.encoding)
+        # Hold the flush lock so queued rows can't be appended mid-rewrite
+        with self._flush_lock:
+            self._flush_quietly()
 
-            if df.empty:
+            if not self.file_path.exists():
                 return 0
 
-            original_count = len(df)
-
-            # Determine which datetime column to use
-            date_column = None
-            if 'created_at' in df.columns:
-                date_column = 'created_at'
-            elif 'timestamp' in df.columns:
-                date_column = 'timestamp'
-            else:
-                # No date column - file is malformed, clear it
-                logger.warning("No date column found, clearing CSV file")
-                self.clear()
-                return original_count
-
-            # Parse date column as datetime
-            df[date_column] = pd.to_datetime(df[date_column], errors='coerce')
-
             # Calculate cutoff time (use UTC to match CSV timestamps)
             cutoff_time = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
 
-            # Filter to keep only records within the time window
-            df_filtered = df[df[date_column] >= cutoff_time]
+            try:
+                tmp_path = self.file_path.with_name(self.file_path.name + '.tmp')
+                original_count = 0
+                removed_count = 0
+
+                # Stream rows, copying the ones inside the window to a temp file
+                with open(self.file_path, 'r', newline='', encoding=self.encoding) as src:
+                    header_line = src.readline()
+                    header = next(csv.reader([header_line]), [])
+
+                    # Determine which datetime column to use
+                    if 'created_at' in header:
+                        date_index = header.index('created_at')
+                    elif 'timestamp' in header:
+                        date_index = header.index('timestamp')
+                    else:
+                        date_index = None
+
+                    if date_index is not None:
+                        with open(tmp_path, 'w', newline='', encoding=self.encoding,
+                                  buffering=1 << 16) as dst:
+                            dst.write(header_line)
+                            for line in src:
+                                if not line.strip():
+                                    continue
+                                original_count += 1
+                                if self._row_is_recent(line, date_index, cutoff_time):
+                                    dst.write(line)
+                                else:
+                                    removed_count += 1
+                    else:
+                        original_count = sum(1 for line in src if line.strip())
+
+                if date_index is None:
+                    # No date column - file is malformed, clear it
+                    logger.warning("No date column found, clearing CSV file")
+                    self.clear()
+                    return original_count
+
+                if removed_count > 0:
+                    os.replace(tmp_path, self.file_path)
+                    logger.info(f"Cleaned up {removed_count} old records (older than {max_age_hours}h)")
+                else:
+                    tmp_path.unlink(missing_ok=True)
+
+                return removed_count
+
+            except Exception as e:
+                logger.error(f"Failed to cleanup old records: {e}", exc_info=True)
+                return 0
 
-            removed_count = original_count - len(df_filtered)
+    @staticmethod
+    def _row_is_recent(line: str, date_index: int, cutoff_time: datetime) -> bool:
+        """
+        Check whether a raw CSV line's date column is at or after the cutoff.
 
-            if removed_count > 0:
-                # Write filtered data back to CSV
-                df_filtered.to_csv(self.file_path, index=False, encoding=self.encoding)
-                logger.info(f"Cleaned up {removed_count} old records (older than {max_age_hours}h)")
+        Naive timestamps are treated as UTC; missing or unparseable dates
+        count as expired.
+        """
+        # Signal fields never contain commas, so only quoted lines need the csv module
+        fields = next(csv.reader([line])) if '"' in line else line.rstrip('\r\n').split(',')
 
-            return removed_count
+        try:
+            value = datetime.fromisoformat(fields[date_index])
+        except (IndexError, ValueError):
+            return False
 
-        except Exception as e:
-            logger.error(f"Failed to cleanup old records: {e}", exc_info=True)
-            return 0
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value >= cutoff_time
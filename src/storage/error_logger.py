@@ -1,18 +1,67 @@
 """Error logger for failed signal extractions"""
+import atexit
+import codecs
 import json
 import logging
+import mmap
+import os
+import threading
+import time
+from collections import deque
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from ..extraction.models import ExtractionError
 
 
 logger = logging.getLogger(__name__)
 
+_now = datetime.now
+
+
+def _json_default(obj):
+    """json.dumps fallback for values orjson serializes natively"""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 
 class ErrorLogger:
-    """Logs extraction errors to JSONL file"""
+    """
+    Logs extraction errors to JSONL file
+
+    Records are queued in memory and appended in batches by a background
+    flusher thread (every FLUSH_INTERVAL seconds, or sooner once
+    FLUSH_BATCH_SIZE records are waiting), so an error burst costs one file
+    append per batch rather than one per record. Reads flush first; call
+    flush() when a record must be on disk, and close() (also registered with
+    atexit) on shutdown.
+    """
+
+    # Background flush policy
+    FLUSH_INTERVAL = 0.5  # seconds
+    FLUSH_BATCH_SIZE = 64
+    # Minimum seconds between repeated log lines while flushes keep failing
+    ERROR_LOG_INTERVAL = 60.0
+
+    # Slice size used when counting lines
+    COUNT_CHUNK_SIZE = 1 << 20
+
+    # Block size used when reading recent records from the end of the file
+    TAIL_CHUNK_SIZE = 1 << 16
+
+    # Block size used when streaming the whole file
+    READ_CHUNK_SIZE = 1 << 20
+
+    # Append-only, binary (O_BINARY only exists on Windows)
+    _OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, 'O_BINARY', 0)
 
     def __init__(self, file_path: Path, encoding: str = 'utf-8'):
         """
@@ -24,6 +73,22 @@ class ErrorLogger:
         """
         self.file_path = Path(file_path)
         self.encoding = encoding
+        # orjson always emits UTF-8, so it is only used for UTF-8 logs
+        self._utf8 = codecs.lookup(encoding).name == 'utf-8'
+
+        # Pending JSON lines and flusher state (thread starts on first log)
+        self._queue: deque = deque()
+        self._flush_lock = threading.RLock()
+        self._wake = threading.Event()
+        self._flush_thread = None
+        self._closed = False
+
+        # Whether the last flush failed, and when that was last logged
+        self._flush_failing = False
+        self._error_logged_at = 0.0
+
+        # O_APPEND descriptor kept open across batches (opened on first flush)
+        self._fd = None
 
         # Ensure parent directory exists
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -38,20 +103,16 @@ class ErrorLogger:
             error: ExtractionError to log
         """
         try:
-            # Convert to dict and then to JSON string
+            # Convert to dict and queue it as a JSON line
             error_dict = error.to_dict()
-            json_line = json.dumps(error_dict, ensure_ascii=False)
-
-            # Append to file
-            with open(self.file_path, 'a', encoding=self.encoding) as f:
-                f.write(json_line + '\n')
+            self._enqueue(self._encode_line(error_dict))
 
             logger.warning(
-                f"Logged extraction error: {error.channel_username} - {error.error_reason}"
+                "Logged extraction error: %s - %s", error.channel_username, error.error_reason
             )
 
         except Exception as e:
-            logger.error(f"Failed to log extraction error: {e}", exc_info=True)
+            logger.error("Failed to log extraction error: %s", e, exc_info=True)
 
     def log_exception(self, exception: Exception, context: dict):
         """
@@ -67,18 +128,133 @@ class ErrorLogger:
                 'exception_type': type(exception).__name__,
                 'exception_message': str(exception),
                 'context': context,
-                'occurred_at': datetime.now().isoformat(),
+                # Formatted by the encoder (natively in C with orjson)
+                'occurred_at': _now(),
             }
 
-            json_line = json.dumps(error_dict, ensure_ascii=False)
-
-            with open(self.file_path, 'a', encoding=self.encoding) as f:
-                f.write(json_line + '\n')
+            self._enqueue(self._encode_line(error_dict))
 
-            logger.error(f"Logged exception: {type(exception).__name__}: {exception}")
+            logger.error("Logged exception: %s: %s", type(exception).__name__, exception)
 
         except Exception as e:
-            logger.error(f"Failed to log exception: {e}", exc_info=True)
+            logger.error("Failed to log exception: %s", e, exc_info=True)
+
+    def flush(self) -> int:
+        """
+        Write all queued records to the log file
+
+        Returns:
+            Number of records written
+
+        Raises:
+            IOError: If write fails (records stay queued for the next attempt)
+        """
+        with self._flush_lock:
+            batch = []
+            while self._queue:
+                batch.append(self._queue.popleft())
+
+            if not batch:
+                return 0
+
+            # One os.write per batch on an O_APPEND descriptor: no Python-side
+            # buffer that could flush a record in pieces, and every write lands
+            # at the current end of file
+            payload = b''.join(batch)
+            written = 0
+            try:
+                if self._fd is None:
+                    self._fd = os.open(self.file_path, self._OPEN_FLAGS, 0o644)
+                view = memoryview(payload)
+                while written < len(payload):
+                    written += os.write(self._fd, view[written:])
+            except Exception as e:
+                # Drop the descriptor so the next attempt reopens the file, and
+                # requeue only the bytes that did not reach it
+                self._close_handle()
+                self._queue.appendleft(payload[written:])
+                now = time.monotonic()
+                if not self._flush_failing or now - self._error_logged_at >= self.ERROR_LOG_INTERVAL:
+                    logger.error(f"Failed to write error log: {e}", exc_info=True)
+                    self._error_logged_at = now
+                self._flush_failing = True
+                raise IOError(f"Error log write failed: {e}") from e
+
+            if self._flush_failing:
+                logger.info("Error log writes recovered")
+                self._flush_failing = False
+
+            return len(batch)
+
+    def close(self):
+        """Stop the background flusher and write any remaining records"""
+        self._closed = True
+        self._wake.set()
+
+        thread = self._flush_thread
+        if thread and thread is not threading.current_thread():
+            thread.join(timeout=5)
+
+        self._flush_quietly()
+
+        with self._flush_lock:
+            self._close_handle()
+
+        atexit.unregister(self.close)
+
+    def _close_handle(self):
+        """Close the append descriptor if open (call under _flush_lock)"""
+        fd, self._fd = self._fd, None
+        if fd is not None:
+            try:
+                os.close(fd)
+            except Exception as e:
+                logger.warning(f"Failed to close error log file: {e}")
+
+    def _flush_quietly(self):
+        """Flush queued records, leaving them queued (and logged) on failure"""
+        try:
+            self.flush()
+        except IOError:
+            pass
+
+    def _encode_line(self, error_dict: dict) -> bytes:
+        """Serialize a record to one encoded JSONL line, using orjson when available"""
+        if ORJSON_AVAILABLE and self._utf8:
+            # OPT_NON_STR_KEYS: stringify non-str context keys like json.dumps does
+            return orjson.dumps(error_dict, option=orjson.OPT_NON_STR_KEYS) + b'\n'
+        line = json.dumps(error_dict, ensure_ascii=False, default=_json_default)
+        return (line + '\n').encode(self.encoding)
+
+    def _enqueue(self, line: bytes):
+        """Queue an encoded JSON line and make sure the flusher is running"""
+        self._queue.append(line)
+
+        if self._closed:
+            # No flusher after close(); write through so late errors aren't lost
+            with self._flush_lock:
+                self._flush_quietly()
+                self._close_handle()
+            return
+
+        if self._flush_thread is None:
+            with self._flush_lock:
+                if self._flush_thread is None:
+                    self._flush_thread = threading.Thread(
+                        target=self._flush_loop, name="ErrorLoggerFlush", daemon=True
+                    )
+                    self._flush_thread.start()
+                    atexit.register(self.close)
+
+        if len(self._queue) >= self.FLUSH_BATCH_SIZE:
+            self._wake.set()
+
+    def _flush_loop(self):
+        """Background thread: flush on interval or when the batch fills up"""
+        while not self._closed:
+            self._wake.wait(self.FLUSH_INTERVAL)
+            self._wake.clear()
+            self._flush_quietly()
 
     def read_errors(self, limit: int = None) -> List[dict]:
         """
@@ -88,34 +264,109 @@ class ErrorLogger:
             limit: Maximum number of errors to read (None = all)
 
         Returns:
-            List of error dictionaries (most recent first if limit specified)
+            List of error dictionaries, oldest first (the last `limit` if specified)
         """
+        if not limit:
+            return list(self.iter_errors())
+
+        self._flush_quietly()
+
         if not self.file_path.exists():
             return []
 
+        return self._read_tail(limit)
+
+    def iter_errors(self) -> Iterator[dict]:
+        """
+        Iterate over logged errors one at a time, oldest first
+
+        The log file stays open until the iterator is exhausted or closed, so
+        consume it fully or call close() on it.
+
+        Yields:
+            Error dictionaries
+        """
+        self._flush_quietly()
+
+        if not self.file_path.exists():
+            return
+
+        try:
+            with open(self.file_path, 'rb') as f:
+                # Split READ_CHUNK_SIZE blocks into lines in C rather than
+                # iterating the file line by line
+                partial = b''
+                while True:
+                    block = f.read(self.READ_CHUNK_SIZE)
+                    if not block:
+                        break
+                    lines = (partial + block).split(b'\n')
+                    partial = lines.pop()
+                    yield from self._parse_lines(lines)
+
+                yield from self._parse_lines((partial,))
+
+        except Exception as e:
+            logger.error(f"Failed to read error log: {e}")
+
+    def _parse_lines(self, lines) -> Iterator[dict]:
+        """Parse raw JSONL lines, skipping blank lines and logging malformed ones"""
+        parse = self._parse_line
+        for raw in lines:
+            if not raw or raw.isspace():
+                continue
+            try:
+                yield parse(raw)
+            except ValueError as e:
+                logger.warning(f"Failed to parse error log line: {e}")
+
+    def _parse_line(self, raw: bytes) -> dict:
+        """Parse one raw JSONL line, using orjson on the bytes when available"""
+        if ORJSON_AVAILABLE and self._utf8:
+            return orjson.loads(raw)
+        return json.loads(raw.decode(self.encoding))
+
+    def _read_tail(self, limit: int) -> List[dict]:
+        """
+        Parse only the last `limit` records by reading the file backwards
+
+        Args:
+            limit: Number of records wanted
+
+        Returns:
+            Up to `limit` error dictionaries, oldest first
+        """
         errors = []
 
         try:
-            with open(self.file_path, 'r', encoding=self.encoding) as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        try:
-                            error_dict = json.loads(line)
-                            errors.append(error_dict)
-                        except json.JSONDecodeError as e:
-                            logger.warning(f"Failed to parse error log line: {e}")
-
-            # Return most recent first if limit specified
-            if limit:
-                errors = errors[-limit:]
+            for error_dict in self._parse_lines(self._iter_lines_reversed()):
+                errors.append(error_dict)
+                if len(errors) >= limit:
+                    break
 
+            errors.reverse()
             return errors
 
         except Exception as e:
             logger.error(f"Failed to read error log: {e}")
             return []
 
+    def _iter_lines_reversed(self):
+        """Yield raw lines from the end of the file, reading TAIL_CHUNK_SIZE blocks backwards"""
+        with open(self.file_path, 'rb') as f:
+            position = f.seek(0, os.SEEK_END)
+            partial = b''
+            while position > 0:
+                step = min(self.TAIL_CHUNK_SIZE, position)
+                position -= step
+                f.seek(position)
+                lines = (f.read(step) + partial).split(b'\n')
+                # First piece may be cut mid-line; carry it into the next block
+                partial = lines[0]
+                for line in reversed(lines[1:]):
+                    yield line
+            yield partial
+
     def get_error_count(self) -> int:
         """
         Get total number of errors logged
@@ -123,14 +374,27 @@ class ErrorLogger:
         Returns:
             Error count
         """
+        self._flush_quietly()
+
         if not self.file_path.exists():
             return 0
 
-        count = 0
         try:
-            with open(self.file_path, 'r', encoding=self.encoding) as f:
-                for _ in f:
-                    count += 1
+            with open(self.file_path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size == 0:
+                    return 0
+
+                # Count newlines over a memory map in 1 MiB slices; no per-line objects
+                with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+                    count = 0
+                    for offset in range(0, size, self.COUNT_CHUNK_SIZE):
+                        count += mm[offset:offset + self.COUNT_CHUNK_SIZE].count(b'\n')
+
+                    # Unterminated final line still counts
+                    if mm[size - 1:size] != b'\n':
+                        count += 1
+
             return count
         except Exception as e:
             logger.error(f"Failed to count errors: {e}")
@@ -151,7 +415,11 @@ class ErrorLogger:
     def clear(self):
         """Clear all errors from log file"""
         try:
-            self.file_path.unlink(missing_ok=True)
+            with self._flush_lock:
+                self._queue.clear()
+                # Close first: an open handle blocks unlink on Windows
+                self._close_handle()
+                self.file_path.unlink(missing_ok=True)
             logger.info("Cleared error log file")
         except Exception as e:
             logger.error(f"Failed to clear error log: {e}")
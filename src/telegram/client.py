@@ -2,7 +2,7 @@
 import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Callable, List, Optional, AsyncGenerator, Tuple
+from typing import Callable, Dict, List, Optional, AsyncGenerator, Set, Tuple
 from pathlib import Path
 
 from telethon import TelegramClient, events
@@ -38,6 +38,12 @@ class TelegramListener:
 
         self.connected = False
         self.channels: List[str] = []
+        # Membership index for self.channels (the list keeps insertion order)
+        self._channels_set: Set[str] = set()
+        # Resolved channel entities by username; saves a Telegram round-trip per lookup
+        self._entity_cache: Dict[str, object] = {}
+        # Chat entities by chat ID, so incoming messages skip event.get_chat()
+        self._chats_by_id: Dict[int, object] = {}
         self._message_handlers: List[Callable] = []
         self._edit_handlers: List[Callable] = []
 
@@ -142,7 +148,8 @@ class TelegramListener:
         if channel_username.startswith('@'):
             channel_username = channel_username[1:]
 
-        if channel_username not in self.channels:
+        if channel_username not in self._channels_set:
+            self._channels_set.add(channel_username)
             self.channels.append(channel_username)
             logger.info(f"Added channel to monitor: @{channel_username}")
 
@@ -156,8 +163,14 @@ class TelegramListener:
         if channel_username.startswith('@'):
             channel_username = channel_username[1:]
 
-        if channel_username in self.channels:
+        if channel_username in self._channels_set:
+            self._channels_set.discard(channel_username)
             self.channels.remove(channel_username)
+            self._entity_cache.pop(channel_username, None)
+            self._chats_by_id = {
+                chat_id: chat for chat_id, chat in self._chats_by_id.items()
+                if getattr(chat, 'username', None) != channel_username
+            }
             logger.info(f"Removed channel from monitoring: @{channel_username}")
 
     def on_new_message(self, handler: Callable):
@@ -197,48 +210,101 @@ class TelegramListener:
         async def handle_new_message(event):
             try:
                 message = event.message
-                chat = await event.get_chat()
-
-                channel_username = getattr(chat, 'username', 'unknown')
-                logger.debug(f"New message from @{channel_username}: {message.id}")
+                chat, channel_username = await self._resolve_event_chat(event)
+                logger.debug("New message from @%s: %s", channel_username, message.id)
 
-                # Call all registered handlers
-                for handler in self._message_handlers:
-                    try:
-                        await handler(message, chat)
-                    except Exception as e:
-                        logger.error(f"Error in message handler {handler.__name__}: {e}", exc_info=True)
+                # Call all registered handlers concurrently
+                await self._dispatch(self._message_handlers, message, chat, "message")
 
             except Exception as e:
-                logger.error(f"Error processing new message: {e}", exc_info=True)
+                logger.error("Error processing new message: %s", e, exc_info=True)
 
         # Register event handler for edited messages
         @self.client.on(events.MessageEdited(chats=self.channels))
         async def handle_edited_message(event):
             try:
                 message = event.message
-                chat = await event.get_chat()
-
-                channel_username = getattr(chat, 'username', 'unknown')
-                logger.info(f"Edited message from @{channel_username}: {message.id}")
+                chat, channel_username = await self._resolve_event_chat(event)
+                logger.info("Edited message from @%s: %s", channel_username, message.id)
 
                 # Call edit handlers if registered, otherwise fall back to message handlers
                 handlers = self._edit_handlers if self._edit_handlers else self._message_handlers
-                for handler in handlers:
-                    try:
-                        await handler(message, chat)
-                    except Exception as e:
-                        logger.error(f"Error in edit handler {handler.__name__}: {e}", exc_info=True)
+                await self._dispatch(handlers, message, chat, "edit")
 
             except Exception as e:
-                logger.error(f"Error processing edited message: {e}", exc_info=True)
+                logger.error("Error processing edited message: %s", e, exc_info=True)
 
         logger.info("Message monitoring started (new + edited). Press Ctrl+C to stop.")
 
+    async def _resolve_event_chat(self, event) -> Tuple[object, str]:
+        """
+        Get the chat entity and username for a message event
+
+        The entity is fetched with event.get_chat() only the first time a chat
+        is seen; later messages from it are served from the chat ID cache.
+
+        Args:
+            event: Telethon message event
+
+        Returns:
+            Tuple of (chat entity, channel username or 'unknown')
+        """
+        chat_id = event.chat_id
+        chat = self._chats_by_id.get(chat_id)
+        if chat is None:
+            chat = await event.get_chat()
+            self._chats_by_id[chat_id] = chat
+
+        try:
+            channel_username = chat.username or 'unknown'
+        except AttributeError:
+            channel_username = 'unknown'
+        else:
+            if channel_username != 'unknown':
+                self._entity_cache.setdefault(channel_username, chat)
+
+        return chat, channel_username
+
+    @staticmethod
+    async def _dispatch(handlers: List[Callable], message, chat, kind: str):
+        """
+        Run handlers concurrently; a failing handler is logged without affecting the others
+
+        Args:
+            handlers: Async handlers to call with (message, chat)
+            message: Telegram message
+            chat: Chat the message came from
+            kind: Handler kind for log messages ("message" or "edit")
+        """
+        handlers = list(handlers)
+        results = await asyncio.gather(
+            *(handler(message, chat) for handler in handlers),
+            return_exceptions=True
+        )
+        for handler, result in zip(handlers, results):
+            if isinstance(result, Exception):
+                logger.error("Error in %s handler %s: %s", kind, handler.__name__, result, exc_info=result)
+
     async def run_until_disconnected(self):
         """Run the client until disconnected"""
         await self.client.run_until_disconnected()
 
+    async def _get_entity(self, channel_username: str):
+        """
+        Resolve a channel entity, reusing earlier lookups
+
+        Args:
+            channel_username: Channel username (without @)
+
+        Returns:
+            Telethon entity for the channel
+        """
+        entity = self._entity_cache.get(channel_username)
+        if entity is None:
+            entity = await self.client.get_entity(channel_username)
+            self._entity_cache[channel_username] = entity
+        return entity
+
     async def get_channel_info(self, channel_username: str) -> dict:
         """
         Get information about a channel
@@ -253,13 +319,22 @@ class TelegramListener:
             channel_username = channel_username[1:]
 
         try:
-            entity = await self.client.get_entity(channel_username)
-            return {
-                'id': entity.id,
-                'title': getattr(entity, 'title', ''),
-                'username': getattr(entity, 'username', ''),
-                'participants_count': getattr(entity, 'participants_count', None)
-            }
+            entity = await self._get_entity(channel_username)
+            try:
+                return {
+                    'id': entity.id,
+                    'title': entity.title,
+                    'username': entity.username,
+                    'participants_count': entity.participants_count
+                }
+            except AttributeError:
+                # Not a channel (e.g. a user entity); probe each field
+                return {
+                    'id': entity.id,
+                    'title': getattr(entity, 'title', ''),
+                    'username': getattr(entity, 'username', ''),
+                    'participants_count': getattr(entity, 'participants_count', None)
+                }
         except Exception as e:
             logger.error(f"Failed to get info for @{channel_username}: {e}")
             return {}
@@ -284,6 +359,21 @@ class TelegramListener:
             logger.error(f"Cannot access channel @{channel_username}: {e}")
             return False
 
+    async def test_channels_access(self, channel_usernames: List[str]) -> Dict[str, bool]:
+        """
+        Test access to several channels concurrently
+
+        Args:
+            channel_usernames: Channel usernames
+
+        Returns:
+            Dictionary mapping each username to whether it is accessible
+        """
+        results = await asyncio.gather(
+            *(self.test_channel_access(username) for username in channel_usernames)
+        )
+        return dict(zip(channel_usernames, results))
+
     async def fetch_historical_messages(
         self,
         hours: int = 24,
@@ -319,7 +409,7 @@ class TelegramListener:
                 channel_username = channel_username[1:]
 
             try:
-                entity = await self.client.get_entity(channel_username)
+                entity = await self._get_entity(channel_username)
                 channel_messages = 0
 
                 async for message in self.client.iter_messages(
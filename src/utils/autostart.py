@@ -1,7 +1,18 @@
 """Cross-platform autostart utility for Windows and macOS"""
 import sys
 import logging
+import string
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    import win32api
+    import win32con
+    import win32event
+    PYWIN32_AVAILABLE = True
+except ImportError:
+    PYWIN32_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -9,36 +20,100 @@ logger = logging.getLogger(__name__)
 APP_NAME = "TelegramSignals"
 MACOS_BUNDLE_ID = "com.telegramdignals.app"
 
+# How this process was launched; fixed for its lifetime, so resolved once
+_IS_FROZEN = getattr(sys, 'frozen', False)  # Compiled executable (PyInstaller)
+_EXE_PATH = sys.executable  # The executable, or the Python interpreter for a script
+_EXE_ARGS = () if _IS_FROZEN else (sys.argv[0],)  # Script path when not frozen
+
 
 def get_executable_path() -> str:
     """Get the path to the current executable or script"""
-    if getattr(sys, 'frozen', False):
-        # Running as compiled executable (PyInstaller)
-        return sys.executable
-    else:
-        # Running as Python script - return python and script path
-        return sys.executable
+    return _EXE_PATH
 
 
 def get_executable_args() -> list:
     """Get the arguments needed to run the app"""
-    if getattr(sys, 'frozen', False):
-        return []
-    else:
-        # Running as Python script
-        return [sys.argv[0]]
+    return list(_EXE_ARGS)
 
 
 # =============================================================================
 # Windows Implementation
 # =============================================================================
 
+_RUN_KEY_PATH = r"Software\Microsoft\Windows\CurrentVersion\Run"
+
+
+@contextmanager
+def _open_run_key(access: int):
+    """Open the HKCU Run key with the given access, closing it on exit"""
+    import winreg
+
+    key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, _RUN_KEY_PATH, 0, access)
+    try:
+        yield key
+    finally:
+        winreg.CloseKey(key)
+
+
+class _RunKeyWatcher:
+    """
+    Caches Run key lookups until the key changes (Windows, needs pywin32)
+
+    RegNotifyChangeKeyValue signals an event whenever a value under the Run
+    key is set or deleted, so repeated is_autostart_enabled() calls only hit
+    the registry after something actually changed.
+    """
+
+    def __init__(self):
+        self._key = None
+        self._event = None
+        self._cache: Dict[str, bool] = {}
+
+    def get(self, app_name: str) -> Optional[bool]:
+        """Return the cached state for app_name, or None if it must be queried"""
+        try:
+            if self._key is None:
+                self._event = win32event.CreateEvent(None, False, False, None)
+                self._key = win32api.RegOpenKeyEx(
+                    win32con.HKEY_CURRENT_USER,
+                    _RUN_KEY_PATH,
+                    0,
+                    win32con.KEY_NOTIFY | win32con.KEY_READ
+                )
+                self._arm()
+            elif win32event.WaitForSingleObject(self._event, 0) == win32event.WAIT_OBJECT_0:
+                # Re-arm before dropping the cache so a change during the
+                # re-query is not missed
+                self._arm()
+                self._cache.clear()
+        except Exception as e:
+            logger.debug(f"Run key change notifications unavailable: {e}")
+            self._key = None
+            self._cache.clear()
+            return None
+
+        return self._cache.get(app_name)
+
+    def put(self, app_name: str, enabled: bool):
+        """Remember a freshly queried state (only while notifications are armed)"""
+        if self._key is not None:
+            self._cache[app_name] = enabled
+
+    def _arm(self):
+        """Request a one-shot notification for the next value change"""
+        win32api.RegNotifyChangeKeyValue(
+            self._key, False, win32con.REG_NOTIFY_CHANGE_LAST_SET, self._event, True
+        )
+
+
+_run_key_watcher = _RunKeyWatcher() if PYWIN32_AVAILABLE else None
+
+
 def _set_autostart_windows(enable: bool, app_name: str) -> bool:
     """Windows: Add or remove app from registry autostart"""
     try:
         import winreg
 
-        key_path = r"Software\Microsoft\Windows\CurrentVersion\Run"
         exe_path = get_executable_path()
         args = get_executable_args()
 
@@ -48,14 +123,7 @@ def _set_autostart_windows(enable: bool, app_name: str) -> bool:
         else:
             full_cmd = f'"{exe_path}"'
 
-        key = winreg.OpenKey(
-            winreg.HKEY_CURRENT_USER,
-            key_path,
-            0,
-            winreg.KEY_SET_VALUE | winreg.KEY_READ
-        )
-
-        try:
+        with _open_run_key(winreg.KEY_SET_VALUE | winreg.KEY_READ) as key:
             if enable:
                 winreg.SetValueEx(key, app_name, 0, winreg.REG_SZ, full_cmd)
                 logger.info(f"Autostart enabled for {app_name} (Windows)")
@@ -65,9 +133,12 @@ def _set_autostart_windows(enable: bool, app_name: str) -> bool:
                     logger.info(f"Autostart disabled for {app_name} (Windows)")
                 except FileNotFoundError:
                     pass
-            return True
-        finally:
-            winreg.CloseKey(key)
+
+        # The change notification may not have been observed yet; don't let
+        # the next check return the state from before this write
+        if _run_key_watcher is not None:
+            _run_key_watcher.put(app_name, enable)
+        return True
 
     except PermissionError:
         logger.error("Permission denied when modifying autostart registry")
@@ -79,24 +150,24 @@ def _set_autostart_windows(enable: bool, app_name: str) -> bool:
 
 def _is_autostart_enabled_windows(app_name: str) -> bool:
     """Windows: Check if autostart is enabled in registry"""
+    if _run_key_watcher is not None:
+        cached = _run_key_watcher.get(app_name)
+        if cached is not None:
+            return cached
+
     try:
         import winreg
 
-        key_path = r"Software\Microsoft\Windows\CurrentVersion\Run"
-        key = winreg.OpenKey(
-            winreg.HKEY_CURRENT_USER,
-            key_path,
-            0,
-            winreg.KEY_READ
-        )
+        with _open_run_key(winreg.KEY_READ) as key:
+            try:
+                winreg.QueryValueEx(key, app_name)
+                enabled = True
+            except FileNotFoundError:
+                enabled = False
 
-        try:
-            winreg.QueryValueEx(key, app_name)
-            return True
-        except FileNotFoundError:
-            return False
-        finally:
-            winreg.CloseKey(key)
+        if _run_key_watcher is not None:
+            _run_key_watcher.put(app_name, enabled)
+        return enabled
 
     except Exception as e:
         logger.error(f"Failed to check Windows autostart status: {e}")
@@ -112,38 +183,41 @@ def _get_launchagent_path(app_name: str) -> Path:
     return Path.home() / "Library" / "LaunchAgents" / f"{MACOS_BUNDLE_ID}.plist"
 
 
-def _create_launchagent_plist(app_name: str) -> str:
-    """Create the Launch Agent plist content"""
-    exe_path = get_executable_path()
-    args = get_executable_args()
-
-    # Build program arguments array
-    program_args = [f"        <string>{exe_path}</string>"]
-    for arg in args:
-        program_args.append(f"        <string>{arg}</string>")
-    program_args_str = "\n".join(program_args)
-
-    return f"""<?xml version="1.0" encoding="UTF-8"?>
+_PLIST_TEMPLATE = string.Template("""<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
 <plist version="1.0">
 <dict>
     <key>Label</key>
-    <string>{MACOS_BUNDLE_ID}</string>
+    <string>${label}</string>
     <key>ProgramArguments</key>
     <array>
-{program_args_str}
+${program_args}
     </array>
     <key>RunAtLoad</key>
     <true/>
     <key>KeepAlive</key>
     <false/>
     <key>StandardOutPath</key>
-    <string>/tmp/{app_name}.stdout.log</string>
+    <string>/tmp/${app_name}.stdout.log</string>
     <key>StandardErrorPath</key>
-    <string>/tmp/{app_name}.stderr.log</string>
+    <string>/tmp/${app_name}.stderr.log</string>
 </dict>
 </plist>
-"""
+""")
+
+# ProgramArguments entries for this process (executable first)
+_PLIST_PROGRAM_ARGS = "\n".join(
+    f"        <string>{arg}</string>" for arg in (_EXE_PATH, *_EXE_ARGS)
+)
+
+
+def _create_launchagent_plist(app_name: str) -> str:
+    """Create the Launch Agent plist content"""
+    return _PLIST_TEMPLATE.substitute(
+        label=MACOS_BUNDLE_ID,
+        program_args=_PLIST_PROGRAM_ARGS,
+        app_name=app_name,
+    )
 
 
 def _set_autostart_macos(enable: bool, app_name: str) -> bool:
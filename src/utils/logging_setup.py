@@ -1,11 +1,17 @@
 """Logging configuration for Telegram Signal Extractor"""
+import atexit
 import logging
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from typing import Optional
 
 
+# Background thread that owns the console/file handlers (see setup_logging)
+_queue_listener: Optional[QueueListener] = None
+
+
 def setup_logging(config: dict, project_root: Optional[Path] = None) -> logging.Logger:
     """
     Configure logging for the application
@@ -16,6 +22,11 @@ def setup_logging(config: dict, project_root: Optional[Path] = None) -> logging.
 
     Returns:
         Configured root logger
+
+    The root logger only gets a QueueHandler; the console and file handlers
+    run on a QueueListener thread, so logging calls (including from the
+    asyncio event loop) never wait on console or disk I/O. Call
+    shutdown_logging() to flush pending records (also done at exit).
     """
     if project_root is None:
         # Fallback for when project_root is not provided
@@ -37,8 +48,10 @@ def setup_logging(config: dict, project_root: Optional[Path] = None) -> logging.
     logger = logging.getLogger()
     logger.setLevel(getattr(logging, log_level))
 
-    # Remove existing handlers
+    # Remove existing handlers (and stop the listener from a previous setup)
+    shutdown_logging()
     logger.handlers.clear()
+    handlers = []
 
     # Console handler
     if config.get('console', {}).get('enabled', True):
@@ -46,7 +59,7 @@ def setup_logging(config: dict, project_root: Optional[Path] = None) -> logging.
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(getattr(logging, console_level))
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
     # File handler
     if config.get('file', {}).get('enabled', True):
@@ -73,12 +86,32 @@ def setup_logging(config: dict, project_root: Optional[Path] = None) -> logging.
         )
         file_handler.setLevel(getattr(logging, file_level))
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    if handlers:
+        global _queue_listener
+        log_queue = queue.Queue(-1)
+        _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _queue_listener.start()
+        logger.addHandler(QueueHandler(log_queue))
 
     logger.info(f"Logging configured - Level: {log_level}")
     return logger
 
 
+def shutdown_logging():
+    """Stop the background log listener, writing out any queued records"""
+    global _queue_listener
+    listener, _queue_listener = _queue_listener, None
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+atexit.register(shutdown_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance
@@ -27,41 +27,47 @@ config = {
     }
 }
 
-extractor = SignalExtractor(config)
+def run_demo():
+    """Run is_signal() and extract_signal() on the sample text and print the results"""
+    extractor = SignalExtractor(config)
 
-# Test is_signal
-print("=" * 60)
-print("Testing is_signal()")
-print("=" * 60)
-print(f"Text:\n{test_text}\n")
-print(f"is_signal() result: {extractor.is_signal(test_text)}")
-print()
+    # Test is_signal
+    print("=" * 60)
+    print("Testing is_signal()")
+    print("=" * 60)
+    print(f"Text:\n{test_text}\n")
+    print(f"is_signal() result: {extractor.is_signal(test_text)}")
+    print()
 
-# Test full extraction
-print("=" * 60)
-print("Testing extract_signal()")
-print("=" * 60)
-try:
-    signal = extractor.extract_signal(
-        text=test_text,
-        message_id=12345,
-        channel_username="test_channel",
-        timestamp=datetime.now()
-    )
+    # Test full extraction
+    print("=" * 60)
+    print("Testing extract_signal()")
+    print("=" * 60)
+    try:
+        signal = extractor.extract_signal(
+            text=test_text,
+            message_id=12345,
+            channel_username="test_channel",
+            timestamp=datetime.now()
+        )
 
-    print(f"[SUCCESS] Signal extracted successfully!")
-    print(f"\nSignal Details:")
-    print(f"  Symbol: {signal.symbol}")
-    print(f"  Direction: {signal.direction}")
-    print(f"  Entry Price: {signal.entry_price}")
-    print(f"  Entry Range: {signal.entry_price_min} - {signal.entry_price_max}")
-    print(f"  Stop Loss: {signal.stop_loss}")
-    print(f"  Take Profits: {signal.take_profits}")
-    print(f"  Confidence Score: {signal.confidence_score:.2f}")
-    if signal.extraction_notes:
-        print(f"  Notes: {signal.extraction_notes}")
+        print(f"[SUCCESS] Signal extracted successfully!")
+        print(f"\nSignal Details:")
+        print(f"  Symbol: {signal.symbol}")
+        print(f"  Direction: {signal.direction}")
+        print(f"  Entry Price: {signal.entry_price}")
+        print(f"  Entry Range: {signal.entry_price_min} - {signal.entry_price_max}")
+        print(f"  Stop Loss: {signal.stop_loss}")
+        print(f"  Take Profits: {signal.take_profits}")
+        print(f"  Confidence Score: {signal.confidence_score:.2f}")
+        if signal.extraction_notes:
+            print(f"  Notes: {signal.extraction_notes}")
 
-except ValueError as e:
-    print(f"[FAILED] Extraction failed: {e}")
+    except ValueError as e:
+        print(f"[FAILED] Extraction failed: {e}")
 
-print()
+    print()
+
+
+if __name__ == '__main__':
+    run_demo()
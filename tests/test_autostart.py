@@ -0,0 +1,61 @@
+"""Test autostart state caching"""
+import sys
+import types
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils import autostart
+
+
+def _fake_winreg(values: dict) -> types.ModuleType:
+    """In-memory stand-in for the winreg calls the Windows backend makes"""
+    winreg = types.ModuleType("winreg")
+    winreg.HKEY_CURRENT_USER = object()
+    winreg.KEY_READ = 1
+    winreg.KEY_SET_VALUE = 2
+    winreg.REG_SZ = 1
+    winreg.OpenKey = lambda root, path, reserved, access: values
+    winreg.CloseKey = lambda key: None
+
+    def set_value(key, name, reserved, kind, value):
+        key[name] = value
+
+    def delete_value(key, name):
+        if name not in key:
+            raise FileNotFoundError(name)
+        del key[name]
+
+    def query_value(key, name):
+        if name not in key:
+            raise FileNotFoundError(name)
+        return key[name], winreg.REG_SZ
+
+    winreg.SetValueEx = set_value
+    winreg.DeleteValue = delete_value
+    winreg.QueryValueEx = query_value
+    return winreg
+
+
+def test_windows_toggle_reads_back_before_change_notification(monkeypatch):
+    """A write is visible to the next check even if RegNotifyChangeKeyValue hasn't fired"""
+    monkeypatch.setattr(sys, "platform", "win32")
+    monkeypatch.setitem(sys.modules, "winreg", _fake_winreg({}))
+
+    # Armed watcher whose change event never signals
+    win32event = types.SimpleNamespace(
+        WAIT_OBJECT_0=0, WaitForSingleObject=lambda event, timeout: 258
+    )
+    monkeypatch.setattr(autostart, "win32event", win32event, raising=False)
+    watcher = autostart._RunKeyWatcher()
+    watcher._key = object()
+    monkeypatch.setattr(autostart, "_run_key_watcher", watcher)
+
+    assert autostart.is_autostart_enabled("TestApp") is False
+
+    assert autostart.set_autostart(True, "TestApp") is True
+    assert autostart.is_autostart_enabled("TestApp") is True
+
+    assert autostart.set_autostart(False, "TestApp") is True
+    assert autostart.is_autostart_enabled("TestApp") is False
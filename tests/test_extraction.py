@@ -1,13 +1,22 @@
 """Test signal extraction with real signal examples"""
 import sys
+import json
+import logging
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
 from pathlib import Path
 from datetime import datetime
+from typing import Callable, List, Optional, Tuple
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.extraction.extractor import SignalExtractor
 from src.extraction.patterns import PatternMatcher
+from src.extraction.models import Signal
+from src.extraction import validators
 from src.extraction.validators import SignalValidator
 
 
@@ -62,49 +71,113 @@ Do not rush your entries"""
 
 NON_SIGNAL_MESSAGE = """Good morning traders! Remember to manage your risk today!"""
 
+GARY_SAMPLES: Tuple[str, ...] = (GARY_GOLD_SAMPLE_1, GARY_GOLD_SAMPLE_2, GARY_GOLD_SAMPLE_3)
 
+# Output lines per thread, written to stdout in one call by _flush()
+_local = threading.local()
+
+
+def _lines() -> List[str]:
+    """Return this thread's output buffer"""
+    lines = getattr(_local, 'lines', None)
+    if lines is None:
+        lines = _local.lines = []
+    return lines
+
+
+def _p(line: str = "") -> None:
+    """Buffer a line of test output"""
+    _lines().append(line)
+
+
+def _flush() -> None:
+    """Write the buffered output in one call, unless the caller collects it"""
+    lines = _lines()
+    if lines and not getattr(_local, 'deferred', False):
+        sys.stdout.write("\n".join(lines) + "\n")
+        lines.clear()
+
+
+def _flushes_output(test: Callable[[], None]) -> Callable[[], None]:
+    """Write a test's buffered output when it finishes, even if it raises"""
+    @wraps(test)
+    def wrapper():
+        try:
+            test()
+        finally:
+            _flush()
+    return wrapper
+
+
+def _run_buffered(test: Callable[[], None]) -> Tuple[List[str], Optional[Exception]]:
+    """Run a test, returning its output lines and any exception instead of writing them"""
+    _local.deferred = True
+    try:
+        test()
+        error = None
+    except Exception as e:
+        error = e
+    finally:
+        _local.deferred = False
+    lines = _lines()[:]
+    _lines().clear()
+    return lines, error
+
+
+# Shared matcher; it holds no per-message state
+_MATCHER = PatternMatcher()
+
+
+@lru_cache(maxsize=4)
+def _get_extractor(cfg_key: str) -> SignalExtractor:
+    """Build one extractor per distinct config (a sorted JSON string) and reuse it"""
+    return SignalExtractor(json.loads(cfg_key))
+
+
+@_flushes_output
 def test_pattern_matcher():
     """Test pattern matching with sample signals"""
-    print("\n" + "="*60)
-    print("TEST: Pattern Matcher")
-    print("="*60)
+    _p("\n" + "="*60)
+    _p("TEST: Pattern Matcher")
+    _p("="*60)
 
-    matcher = PatternMatcher()
+    matcher = _MATCHER
 
     # Test Nick Alpha Trader format
-    print("\n--- Nick Alpha Trader Sample 1 ---")
-    print(f"Is signal: {matcher.is_signal(NICK_ALPHA_SAMPLE_1)}")
-    print(f"Symbol: {matcher.extract_symbol(NICK_ALPHA_SAMPLE_1)}")
-    print(f"Direction: {matcher.extract_direction(NICK_ALPHA_SAMPLE_1)}")
+    _p("\n--- Nick Alpha Trader Sample 1 ---")
+    _p(f"Is signal: {matcher.is_signal(NICK_ALPHA_SAMPLE_1)}")
+    _p(f"Symbol: {matcher.extract_symbol(NICK_ALPHA_SAMPLE_1)}")
+    _p(f"Direction: {matcher.extract_direction(NICK_ALPHA_SAMPLE_1)}")
     entry = matcher.extract_entry(NICK_ALPHA_SAMPLE_1)
-    print(f"Entry: single={entry[0]}, min={entry[1]}, max={entry[2]}")
-    print(f"Stop Loss: {matcher.extract_stop_loss(NICK_ALPHA_SAMPLE_1)}")
+    _p(f"Entry: single={entry[0]}, min={entry[1]}, max={entry[2]}")
+    _p(f"Stop Loss: {matcher.extract_stop_loss(NICK_ALPHA_SAMPLE_1)}")
     tps = matcher.extract_take_profits(NICK_ALPHA_SAMPLE_1)
-    print(f"Take Profits: {tps}")
+    _p(f"Take Profits: {tps}")
 
     # Test Gary Gold Legacy format
-    print("\n--- Gary Gold Legacy Sample 1 ---")
-    print(f"Is signal: {matcher.is_signal(GARY_GOLD_SAMPLE_1)}")
-    print(f"Symbol: {matcher.extract_symbol(GARY_GOLD_SAMPLE_1)}")
-    print(f"Direction: {matcher.extract_direction(GARY_GOLD_SAMPLE_1)}")
+    _p("\n--- Gary Gold Legacy Sample 1 ---")
+    _p(f"Is signal: {matcher.is_signal(GARY_GOLD_SAMPLE_1)}")
+    _p(f"Symbol: {matcher.extract_symbol(GARY_GOLD_SAMPLE_1)}")
+    _p(f"Direction: {matcher.extract_direction(GARY_GOLD_SAMPLE_1)}")
     entry = matcher.extract_entry(GARY_GOLD_SAMPLE_1)
-    print(f"Entry: single={entry[0]}, min={entry[1]}, max={entry[2]}")
-    print(f"Stop Loss: {matcher.extract_stop_loss(GARY_GOLD_SAMPLE_1)}")
+    _p(f"Entry: single={entry[0]}, min={entry[1]}, max={entry[2]}")
+    _p(f"Stop Loss: {matcher.extract_stop_loss(GARY_GOLD_SAMPLE_1)}")
     tps = matcher.extract_take_profits(GARY_GOLD_SAMPLE_1)
-    print(f"Take Profits: {tps}")
+    _p(f"Take Profits: {tps}")
 
     # Test non-signal message
-    print("\n--- Non-Signal Message ---")
-    print(f"Is signal: {matcher.is_signal(NON_SIGNAL_MESSAGE)}")
+    _p("\n--- Non-Signal Message ---")
+    _p(f"Is signal: {matcher.is_signal(NON_SIGNAL_MESSAGE)}")
 
-    print("\n[OK] Pattern Matcher tests passed!")
+    _p("\n[OK] Pattern Matcher tests passed!")
 
 
+@_flushes_output
 def test_signal_extractor():
     """Test full signal extraction"""
-    print("\n" + "="*60)
-    print("TEST: Signal Extractor")
-    print("="*60)
+    _p("\n" + "="*60)
+    _p("TEST: Signal Extractor")
+    _p("="*60)
 
     config = {
         'min_confidence': 0.75,
@@ -121,88 +194,90 @@ def test_signal_extractor():
         }
     }
 
-    extractor = SignalExtractor(config)
+    extractor = _get_extractor(json.dumps(config, sort_keys=True))
+    now = datetime.now()
 
     # Test Nick Alpha Trader
-    print("\n--- Extracting Nick Alpha Trader Signal ---")
+    _p("\n--- Extracting Nick Alpha Trader Signal ---")
     try:
         signal = extractor.extract_signal(
             text=NICK_ALPHA_SAMPLE_1,
             message_id=12345,
             channel_username="nickalphatrader",
-            timestamp=datetime.now()
+            timestamp=now
         )
-        print(f"[OK] Extraction successful!")
-        print(f"  Symbol: {signal.symbol}")
-        print(f"  Direction: {signal.direction}")
-        print(f"  Entry Range: {signal.entry_price_min} - {signal.entry_price_max}")
-        print(f"  Stop Loss: {signal.stop_loss}")
-        print(f"  Take Profits: {signal.take_profits}")
-        print(f"  Confidence: {signal.confidence_score}")
+        _p(f"[OK] Extraction successful!")
+        _p(f"  Symbol: {signal.symbol}")
+        _p(f"  Direction: {signal.direction}")
+        _p(f"  Entry Range: {signal.entry_price_min} - {signal.entry_price_max}")
+        _p(f"  Stop Loss: {signal.stop_loss}")
+        _p(f"  Take Profits: {signal.take_profits}")
+        _p(f"  Confidence: {signal.confidence_score}")
     except Exception as e:
-        print(f"[FAIL] Extraction failed: {e}")
+        _p(f"[FAIL] Extraction failed: {e}")
 
     # Test Gary Gold Legacy
-    print("\n--- Extracting Gary Gold Legacy Signal ---")
+    _p("\n--- Extracting Gary Gold Legacy Signal ---")
     try:
         signal = extractor.extract_signal(
             text=GARY_GOLD_SAMPLE_1,
             message_id=12346,
             channel_username="GaryGoldLegacy",
-            timestamp=datetime.now()
+            timestamp=now
         )
-        print(f"[OK] Extraction successful!")
-        print(f"  Symbol: {signal.symbol}")
-        print(f"  Direction: {signal.direction}")
-        print(f"  Entry Range: {signal.entry_price_min} - {signal.entry_price_max}")
-        print(f"  Stop Loss: {signal.stop_loss}")
-        print(f"  Take Profits: {signal.take_profits}")
-        print(f"  Confidence: {signal.confidence_score}")
+        _p(f"[OK] Extraction successful!")
+        _p(f"  Symbol: {signal.symbol}")
+        _p(f"  Direction: {signal.direction}")
+        _p(f"  Entry Range: {signal.entry_price_min} - {signal.entry_price_max}")
+        _p(f"  Stop Loss: {signal.stop_loss}")
+        _p(f"  Take Profits: {signal.take_profits}")
+        _p(f"  Confidence: {signal.confidence_score}")
     except Exception as e:
-        print(f"[FAIL] Extraction failed: {e}")
+        _p(f"[FAIL] Extraction failed: {e}")
 
     # Test all Gary Gold samples
-    print("\n--- Testing All Gary Gold Samples ---")
-    samples = [GARY_GOLD_SAMPLE_1, GARY_GOLD_SAMPLE_2, GARY_GOLD_SAMPLE_3]
-    for i, sample in enumerate(samples, 1):
-        try:
-            signal = extractor.extract_signal(
-                text=sample,
-                message_id=12346 + i,
-                channel_username="GaryGoldLegacy",
-                timestamp=datetime.now()
-            )
-            print(f"[OK] Sample {i}: {signal.direction} @ {signal.entry_price_min}-{signal.entry_price_max}")
-        except Exception as e:
-            print(f"[FAIL] Sample {i} failed: {e}")
+    _p("\n--- Testing All Gary Gold Samples ---")
+    try:
+        signals = extractor.extract_many(
+            (sample, 12346 + i, "GaryGoldLegacy", now)
+            for i, sample in enumerate(GARY_SAMPLES, 1)
+        )
+        for i, signal in enumerate(signals, 1):
+            if signal is None:
+                _p(f"[FAIL] Sample {i} failed")
+            else:
+                _p(f"[OK] Sample {i}: {signal.direction} @ {signal.entry_price_min}-{signal.entry_price_max}")
+    except Exception as e:
+        _p(f"[FAIL] Batch extraction failed: {e}")
 
     # Test GOLD FX SIGNALS
-    print("\n--- Extracting GOLD FX SIGNALS Signal ---")
+    _p("\n--- Extracting GOLD FX SIGNALS Signal ---")
     try:
         signal = extractor.extract_signal(
             text=GOLD_FX_SIGNALS_SAMPLE_1,
             message_id=12350,
             channel_username="goldfx_signls0",
-            timestamp=datetime.now()
+            timestamp=now
         )
-        print(f"[OK] Extraction successful!")
-        print(f"  Symbol: {signal.symbol}")
-        print(f"  Direction: {signal.direction}")
-        print(f"  Entry Range: {signal.entry_price_min} - {signal.entry_price_max}")
-        print(f"  Stop Loss: {signal.stop_loss}")
-        print(f"  Take Profits: {signal.take_profits}")
-        print(f"  Confidence: {signal.confidence_score}")
+        _p(f"[OK] Extraction successful!")
+        _p(f"  Symbol: {signal.symbol}")
+        _p(f"  Direction: {signal.direction}")
+        _p(f"  Entry Range: {signal.entry_price_min} - {signal.entry_price_max}")
+        _p(f"  Stop Loss: {signal.stop_loss}")
+        _p(f"  Take Profits: {signal.take_profits}")
+        _p(f"  Confidence: {signal.confidence_score}")
     except Exception as e:
-        print(f"[FAIL] Extraction failed: {e}")
+        _p(f"[FAIL] Extraction failed: {e}")
 
-    print("\n[OK] Signal Extractor tests passed!")
+    _p("\n[OK] Signal Extractor tests passed!")
 
 
+@_flushes_output
 def test_validator():
     """Test signal validation"""
-    print("\n" + "="*60)
-    print("TEST: Signal Validator")
-    print("="*60)
+    _p("\n" + "="*60)
+    _p("TEST: Signal Validator")
+    _p("="*60)
 
     config = {
         'min_confidence': 0.75,
@@ -219,67 +294,130 @@ def test_validator():
         }
     }
 
-    extractor = SignalExtractor(config)
+    extractor = _get_extractor(json.dumps(config, sort_keys=True))
+    now = datetime.now()
 
-    print("\n--- Validating SELL Signal Price Logic ---")
+    _p("\n--- Validating SELL Signal Price Logic ---")
     signal = extractor.extract_signal(
         text=NICK_ALPHA_SAMPLE_1,
         message_id=12345,
         channel_username="nickalphatrader",
-        timestamp=datetime.now()
+        timestamp=now
     )
 
     # Check price logic
     avg_entry = signal.get_entry_average()
-    print(f"  Average Entry: {avg_entry}")
-    print(f"  Stop Loss: {signal.stop_loss}")
-    print(f"  Take Profits: {signal.take_profits}")
+    _p(f"  Average Entry: {avg_entry}")
+    _p(f"  Stop Loss: {signal.stop_loss}")
+    _p(f"  Take Profits: {signal.take_profits}")
 
     # For SELL: SL should be above entry, TPs below
     if signal.direction == "SELL":
         if signal.stop_loss > avg_entry:
-            print(f"  [OK] SL ({signal.stop_loss}) > Entry ({avg_entry}) - Correct for SELL")
+            _p(f"  [OK] SL ({signal.stop_loss}) > Entry ({avg_entry}) - Correct for SELL")
         else:
-            print(f"  [FAIL] SL logic incorrect for SELL")
+            _p(f"  [FAIL] SL logic incorrect for SELL")
 
-        if all(tp < avg_entry for tp in signal.take_profits):
-            print(f"  [OK] All TPs below entry - Correct for SELL")
+        # One C-level pass over the TPs; an empty list passes, as all() would
+        if not signal.take_profits or max(signal.take_profits) < avg_entry:
+            _p(f"  [OK] All TPs below entry - Correct for SELL")
         else:
-            print(f"  [FAIL] TP logic incorrect for SELL")
+            _p(f"  [FAIL] TP logic incorrect for SELL")
 
-    print("\n--- Validating BUY Signal Price Logic ---")
+    _p("\n--- Validating BUY Signal Price Logic ---")
     signal = extractor.extract_signal(
         text=GARY_GOLD_SAMPLE_1,
         message_id=12346,
         channel_username="GaryGoldLegacy",
-        timestamp=datetime.now()
+        timestamp=now
     )
 
     avg_entry = signal.get_entry_average()
-    print(f"  Average Entry: {avg_entry}")
-    print(f"  Stop Loss: {signal.stop_loss}")
-    print(f"  Take Profits: {signal.take_profits}")
+    _p(f"  Average Entry: {avg_entry}")
+    _p(f"  Stop Loss: {signal.stop_loss}")
+    _p(f"  Take Profits: {signal.take_profits}")
 
     # For BUY: SL should be below entry, TPs above
     if signal.direction == "BUY":
         if signal.stop_loss < avg_entry:
-            print(f"  [OK] SL ({signal.stop_loss}) < Entry ({avg_entry}) - Correct for BUY")
+            _p(f"  [OK] SL ({signal.stop_loss}) < Entry ({avg_entry}) - Correct for BUY")
         else:
-            print(f"  [FAIL] SL logic incorrect for BUY")
+            _p(f"  [FAIL] SL logic incorrect for BUY")
 
-        if all(tp > avg_entry for tp in signal.take_profits):
-            print(f"  [OK] All TPs above entry - Correct for BUY")
+        if not signal.take_profits or min(signal.take_profits) > avg_entry:
+            _p(f"  [OK] All TPs above entry - Correct for BUY")
         else:
-            print(f"  [FAIL] TP logic incorrect for BUY")
-
-    print("\n[OK] Validator tests passed!")
-
-
+            _p(f"  [FAIL] TP logic incorrect for BUY")
+
+    _p("\n[OK] Validator tests passed!")
+
+
+@_flushes_output
+def test_validator_batch():
+    """Test batch price-logic validation against the per-signal checks"""
+    _p("\n" + "="*60)
+    _p("TEST: Signal Validator (batch)")
+    _p("="*60)
+
+    rng = random.Random(42)
+    now = datetime.now()
+    signals = []
+    for i in range(10000):
+        entry = rng.uniform(1000, 5000)
+        spread = rng.uniform(0, 20)
+        signals.append(Signal(
+            message_id=i,
+            channel_username="synthetic",
+            timestamp=now,
+            symbol="XAUUSD",
+            direction=rng.choice(["BUY", "SELL", ""]),
+            entry_price=entry if rng.random() < 0.5 else None,
+            entry_price_min=entry - spread,
+            entry_price_max=entry + spread,
+            stop_loss=rng.choice([None, 0, entry + rng.uniform(-50, 50)]),
+            take_profits=[entry + rng.uniform(-100, 100) for _ in range(rng.randint(0, 4))],
+        ))
+
+    validator = SignalValidator()
+    # The per-signal checks warn about unusual TP ordering; random TPs trip that constantly.
+    # Only drop records from this thread so tests running alongside keep their logging.
+    validator_logger = logging.getLogger("src.extraction.validators")
+    thread_id = threading.get_ident()
+    quiet = lambda record: record.thread != thread_id or record.levelno >= logging.ERROR
+    validator_logger.addFilter(quiet)
+    try:
+        batch = validator.validate_batch(signals)
+        # Kernel output, compiled or plain Python; None when numpy isn't installed
+        kernel = validators._run_price_logic_kernel(signals) if validators.NUMPY_AVAILABLE else None
+        expected = []
+        for signal in signals:
+            try:
+                validator._validate_price_logic(signal)
+                expected.append(True)
+            except ValueError:
+                expected.append(False)
+    finally:
+        validator_logger.removeFilter(quiet)
+
+    _p(f"  Signals: {len(signals)}, valid: {sum(expected)}")
+    assert batch == expected, "Batch validation disagrees with per-signal validation"
+
+    if kernel is None:
+        _p("  [SKIP] numpy not installed - price-logic kernel not checked")
+    else:
+        mode = "numba" if validators.NUMBA_AVAILABLE else "plain Python"
+        assert kernel == expected, f"Price-logic kernel ({mode}) disagrees with per-signal validation"
+        _p(f"  [OK] Price-logic kernel ({mode}) matches per-signal validation")
+
+    _p("\n[OK] Batch validator tests passed!")
+
+
+@_flushes_output
 def test_csv_output():
     """Test CSV conversion"""
-    print("\n" + "="*60)
-    print("TEST: CSV Output Format")
-    print("="*60)
+    _p("\n" + "="*60)
+    _p("TEST: CSV Output Format")
+    _p("="*60)
 
     config = {
         'min_confidence': 0.75,
@@ -295,44 +433,52 @@ def test_csv_output():
         }
     }
 
-    extractor = SignalExtractor(config)
+    extractor = _get_extractor(json.dumps(config, sort_keys=True))
+    now = datetime.now()
     signal = extractor.extract_signal(
         text=NICK_ALPHA_SAMPLE_1,
         message_id=12345,
         channel_username="nickalphatrader",
-        timestamp=datetime.now()
+        timestamp=now
     )
 
     # Convert to dict (CSV format)
     signal_dict = signal.to_dict()
 
-    print("\nCSV fields:")
+    _p("\nCSV fields:")
     for key, value in signal_dict.items():
-        print(f"  {key}: {value}")
+        _p(f"  {key}: {value}")
 
-    print("\n[OK] CSV output format test passed!")
+    _p("\n[OK] CSV output format test passed!")
 
 
 def run_all_tests():
     """Run all tests"""
-    print("\n" + "="*60)
-    print("RUNNING ALL TESTS")
-    print("="*60)
+    _p("\n" + "="*60)
+    _p("RUNNING ALL TESTS")
+    _p("="*60)
+
+    tests = [test_pattern_matcher, test_signal_extractor, test_validator, test_validator_batch, test_csv_output]
 
     try:
-        test_pattern_matcher()
-        test_signal_extractor()
-        test_validator()
-        test_csv_output()
-
-        print("\n" + "="*60)
-        print("[OK] ALL TESTS PASSED!")
-        print("="*60)
-        print("\nThe signal extraction system is working correctly!")
-        print("You can now run the application with: python src/main.py")
-        print("="*60 + "\n")
+        # Tests share no mutable state; their output is replayed in order
+        with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+            results = list(executor.map(_run_buffered, tests))
+        for lines, error in results:
+            _lines().extend(lines)
+            if error is not None:
+                raise error
+
+        _p("\n" + "="*60)
+        _p("[OK] ALL TESTS PASSED!")
+        _p("="*60)
+        _p("\nThe signal extraction system is working correctly!")
+        _p("You can now run the application with: python src/main.py")
+        _p("="*60 + "\n")
+        _flush()
 
     except Exception as e:
+        _flush()
         print(f"\n[FAIL] TEST FAILED: {e}")
         import traceback
         traceback.print_exc()
@@ -0,0 +1,62 @@
+"""Test HTTP behaviour of the MT5 signal server"""
+import http.client
+import sys
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.server.signal_server import SignalServer
+from src.server.signal_store import SignalStore
+
+
+def _start_server() -> SignalServer:
+    server = SignalServer(SignalStore(), host="127.0.0.1", port=0)
+    server.start()
+    server.port = server._server.server_address[1]
+    return server
+
+
+def test_signals_response_has_date_and_server_headers():
+    """/signals responses carry the Date and Server headers HTTP/1.1 expects"""
+    server = _start_server()
+    try:
+        conn = http.client.HTTPConnection("127.0.0.1", server.port, timeout=5)
+        conn.request("GET", "/signals")
+        response = conn.getresponse()
+        response.read()
+        conn.close()
+    finally:
+        server.stop()
+
+    assert response.status == 200
+    assert parsedate_to_datetime(response.getheader("Date")).tzinfo is not None
+    assert response.getheader("Server").startswith("BaseHTTP/")
+
+
+def test_stop_closes_keep_alive_and_frees_port():
+    """After stop(), open keep-alive sessions are closed and the port can be bound again"""
+    server = _start_server()
+    listener = server._server.socket
+    conn = http.client.HTTPConnection("127.0.0.1", server.port, timeout=5)
+    try:
+        conn.request("GET", "/health")
+        first = conn.getresponse()
+        first.read()
+        assert first.getheader("Connection") is None
+
+        server.stop()
+        assert listener.fileno() == -1
+
+        # The handler thread on this connection answers once more, then hangs up
+        conn.request("GET", "/health")
+        second = conn.getresponse()
+        second.read()
+        assert second.getheader("Connection") == "close"
+    finally:
+        conn.close()
+
+    restarted = SignalServer(SignalStore(), host="127.0.0.1", port=server.port)
+    restarted.start()
+    restarted.stop()
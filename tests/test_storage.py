@@ -0,0 +1,76 @@
+"""Test flush error reporting and shutdown of the batched storage writers"""
+import gc
+import sys
+import weakref
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.extraction.models import ExtractionError, Signal
+from src.storage.csv_writer import CSVWriter
+from src.storage.error_logger import ErrorLogger
+
+
+def _signal(message_id: int) -> Signal:
+    return Signal(
+        message_id=message_id,
+        channel_username="test",
+        timestamp=datetime.now(),
+        symbol="XAUUSD",
+        direction="BUY",
+        entry_price=2000.0,
+        stop_loss=1990.0,
+        take_profits=[2010.0],
+    )
+
+
+def test_csv_flush_error_raised_from_next_write(tmp_path):
+    """A failed flush surfaces from the next write_signal() until a flush succeeds"""
+    csv_path = tmp_path / "signals.csv"
+    writer = CSVWriter(csv_path)
+    try:
+        header = csv_path.read_bytes()
+        # Appending to a directory fails, standing in for a full disk or denied access
+        csv_path.unlink()
+        csv_path.mkdir()
+
+        writer.write_signal(_signal(1))
+        with pytest.raises(IOError):
+            writer.flush()
+        with pytest.raises(IOError):
+            writer.write_signal(_signal(2))
+
+        csv_path.rmdir()
+        csv_path.write_bytes(header)
+        assert writer.flush() == 1
+
+        writer.write_signal(_signal(3))
+        assert [row['message_id'] for row in writer.read_signals()] == [1, 3]
+    finally:
+        writer.close()
+
+
+def test_closed_writers_are_released(tmp_path):
+    """close() drops the atexit hook, so a closed writer can be garbage collected"""
+    writer = CSVWriter(tmp_path / "signals.csv")
+    writer.write_signal(_signal(1))
+    writer.close()
+
+    error_logger = ErrorLogger(tmp_path / "errors.jsonl")
+    error_logger.log_error(ExtractionError(
+        message_id=1,
+        channel_username="test",
+        timestamp=datetime.now(),
+        raw_message="hello",
+        error_reason="no signal",
+    ))
+    error_logger.close()
+
+    refs = [weakref.ref(writer), weakref.ref(error_logger)]
+    del writer, error_logger
+    gc.collect()
+    assert [ref() for ref in refs] == [None, None]
@@ -0,0 +1,52 @@
+"""Test .env parsing in verify_setup"""
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from verify_setup import check_env_file
+
+
+def _write_env(tmp_path: Path, content: bytes) -> Path:
+    env_path = tmp_path / ".env"
+    env_path.write_bytes(content)
+    return env_path
+
+
+def test_env_plain_assignments(tmp_path):
+    """Plain NAME=value lines count as set; placeholders count as missing"""
+    env_path = _write_env(
+        tmp_path,
+        b"TELEGRAM_API_ID=123\nTELEGRAM_API_HASH=your_api_hash_here\nTELEGRAM_PHONE=+1234567890\n",
+    )
+    assert check_env_file(env_path) == (True, ['TELEGRAM_API_HASH', 'TELEGRAM_PHONE'])
+
+
+def test_env_indented_and_exported(tmp_path):
+    """Indentation, an export prefix and spaces around '=' are accepted"""
+    env_path = _write_env(
+        tmp_path,
+        b"  TELEGRAM_API_ID=123\r\nexport TELEGRAM_API_HASH=abc\r\n\tTELEGRAM_PHONE = 254700000000\r\n",
+    )
+    assert check_env_file(env_path) == (True, [])
+
+
+def test_env_utf8_bom(tmp_path):
+    """A UTF-8 byte order mark doesn't hide the first variable"""
+    env_path = _write_env(
+        tmp_path,
+        b"\xef\xbb\xbfTELEGRAM_API_ID=123\nTELEGRAM_API_HASH=abc\nTELEGRAM_PHONE=254700000000\n",
+    )
+    assert check_env_file(env_path) == (True, [])
+
+    # A file holding nothing but the BOM
+    env_path = _write_env(tmp_path, b"\xef\xbb\xbf")
+    assert check_env_file(env_path) == (True, ['TELEGRAM_API_ID', 'TELEGRAM_API_HASH', 'TELEGRAM_PHONE'])
+
+
+def test_env_missing_and_empty_file(tmp_path):
+    """A missing file reports not found; an empty file reports every variable missing"""
+    assert check_env_file(tmp_path / ".env") == (False, [])
+    env_path = _write_env(tmp_path, b"")
+    assert check_env_file(env_path) == (True, ['TELEGRAM_API_ID', 'TELEGRAM_API_HASH', 'TELEGRAM_PHONE'])
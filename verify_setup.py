@@ -1,7 +1,10 @@
 """Verify project setup and readiness"""
+import mmap
+import os
+import re
 import sys
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 # Color codes for terminal
 GREEN = '\033[92m'
@@ -10,20 +13,58 @@ RED = '\033[91m'
 RESET = '\033[0m'
 BOLD = '\033[1m'
 
+# Output lines, written to stdout in one call by _flush()
+_out = []
 
-def check_file(file_path: Path, description: str) -> bool:
+# One NAME=value assignment per line of a .env file, matched on raw bytes.
+# Like python-dotenv, allow indentation, an "export " prefix and spaces around "="
+_ENV_RE = re.compile(
+    rb"^[ \t]*(?:export[ \t]+)?(?P<k>[A-Z_][A-Z0-9_]*)[ \t]*=[ \t]*(?P<v>[^\r\n]*)",
+    re.MULTILINE,
+)
+
+# Notepad saves UTF-8 files with a byte order mark
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+
+def _p(line: str = "") -> None:
+    """Buffer a line of output"""
+    _out.append(line)
+
+
+def _flush() -> None:
+    """Write the buffered output in one call"""
+    if _out:
+        sys.stdout.write("\n".join(_out) + "\n")
+        _out.clear()
+
+
+def _list_dir(directory: Path, listings: Dict[Path, Dict[str, bool]]) -> Dict[str, bool]:
+    """Return {name: is_dir} for a directory's entries, scanning each directory once"""
+    entries = listings.get(directory)
+    if entries is None:
+        try:
+            with os.scandir(directory) as it:
+                entries = {entry.name: entry.is_dir() for entry in it}
+        except OSError:
+            entries = {}
+        listings[directory] = entries
+    return entries
+
+
+def check_file(file_path: Path, description: str, listings: Dict[Path, Dict[str, bool]]) -> bool:
     """Check if a file exists"""
-    exists = file_path.exists()
+    exists = file_path.name in _list_dir(file_path.parent, listings)
     status = f"{GREEN}[OK]{RESET}" if exists else f"{RED}[X]{RESET}"
-    print(f"  {status} {description}: {file_path}")
+    _p(f"  {status} {description}: {file_path}")
     return exists
 
 
-def check_directory(dir_path: Path, description: str) -> bool:
+def check_directory(dir_path: Path, description: str, listings: Dict[Path, Dict[str, bool]]) -> bool:
     """Check if a directory exists"""
-    exists = dir_path.exists() and dir_path.is_dir()
+    exists = _list_dir(dir_path.parent, listings).get(dir_path.name, False)
     status = f"{GREEN}[OK]{RESET}" if exists else f"{RED}[X]{RESET}"
-    print(f"  {status} {description}: {dir_path}")
+    _p(f"  {status} {description}: {dir_path}")
     return exists
 
 
@@ -32,169 +73,187 @@ def check_env_file(env_path: Path) -> Tuple[bool, List[str]]:
     if not env_path.exists():
         return False, []
 
-    with open(env_path, 'r') as f:
-        content = f.read()
+    env = {}
+    with open(env_path, 'rb') as f:
+        # mmap can't map an empty file; there is nothing to parse anyway
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # Scan past a BOM so "^" still matches the first line
+                start = len(_UTF8_BOM) if mm[:len(_UTF8_BOM)] == _UTF8_BOM else 0
+                with memoryview(mm) as view, view[start:] as body:
+                    env = {m['k'].decode('ascii'): m['v'] for m in _ENV_RE.finditer(body)}
 
     required_vars = ['TELEGRAM_API_ID', 'TELEGRAM_API_HASH', 'TELEGRAM_PHONE']
     missing_vars = []
 
     for var in required_vars:
         # Check if variable exists and is not just the example placeholder
-        if f"{var}=" not in content or f"{var}=your_" in content or f"{var}=+" in content:
+        if var not in env or env[var].startswith((b"your_", b"+")):
             missing_vars.append(var)
 
     return True, missing_vars
 
 
+PROJECT_ROOT = Path(__file__).parent
+_SRC, _CFG, _TESTS, _DOCS = (
+    PROJECT_ROOT / "src", PROJECT_ROOT / "config", PROJECT_ROOT / "tests", PROJECT_ROOT / "docs"
+)
+_EXTRACTION, _STORAGE = _SRC / "extraction", _SRC / "storage"
+
+# (path, description) pairs checked by verify_setup()
+CORE_FILES = (
+    (_SRC / "main.py", "Main application"),
+    (_SRC / "config" / "config_manager.py", "Config manager"),
+    (_SRC / "telegram" / "client.py", "Telegram client"),
+    (_EXTRACTION / "extractor.py", "Signal extractor"),
+    (_EXTRACTION / "patterns.py", "Pattern matcher"),
+    (_EXTRACTION / "validators.py", "Validator"),
+    (_STORAGE / "csv_writer.py", "CSV writer"),
+    (_STORAGE / "error_logger.py", "Error logger"),
+    (_SRC / "utils" / "logging_setup.py", "Logging setup"),
+)
+
+CONFIG_FILES = (
+    (_CFG / "config.yaml", "Main configuration"),
+    (_CFG / ".env.example", "Environment template"),
+    (PROJECT_ROOT / "requirements.txt", "Python dependencies"),
+)
+
+DIRECTORIES = (
+    (_SRC, "Source code"),
+    (_CFG, "Configuration"),
+    (_DOCS, "Documentation"),
+    (_TESTS, "Tests"),
+    (PROJECT_ROOT / "output", "Output files (auto-created)"),
+    (PROJECT_ROOT / "logs", "Log files (auto-created)"),
+    (PROJECT_ROOT / "sessions", "Telegram sessions (auto-created)"),
+)
+
+DOC_FILES = (
+    (PROJECT_ROOT / "README.md", "User guide"),
+    (PROJECT_ROOT / "NEXT_STEPS.md", "Getting started"),
+    (PROJECT_ROOT / "BUILD_COMPLETE.md", "Build summary"),
+    (PROJECT_ROOT / "TESTING.md", "Testing guide"),
+)
+
+TEST_FILES = (
+    (_TESTS / "test_extraction.py", "Extraction tests"),
+    (PROJECT_ROOT / "test_extraction.bat", "Test runner (Windows)"),
+)
+
+
 def verify_setup():
     """Verify complete project setup"""
-    project_root = Path(__file__).parent
+    # Directory listings shared by every check, so each directory is read once
+    listings: Dict[Path, Dict[str, bool]] = {}
     checks_passed = 0
     total_checks = 0
 
-    print(f"\n{BOLD}{'='*60}{RESET}")
-    print(f"{BOLD}Telegram Signal Extractor - Setup Verification{RESET}")
-    print(f"{BOLD}{'='*60}{RESET}\n")
+    _p(f"\n{BOLD}{'='*60}{RESET}")
+    _p(f"{BOLD}Telegram Signal Extractor - Setup Verification{RESET}")
+    _p(f"{BOLD}{'='*60}{RESET}\n")
 
     # Check core source files
-    print(f"{BOLD}1. Core Source Files{RESET}")
-    core_files = [
-        (project_root / "src" / "main.py", "Main application"),
-        (project_root / "src" / "config" / "config_manager.py", "Config manager"),
-        (project_root / "src" / "telegram" / "client.py", "Telegram client"),
-        (project_root / "src" / "extraction" / "extractor.py", "Signal extractor"),
-        (project_root / "src" / "extraction" / "patterns.py", "Pattern matcher"),
-        (project_root / "src" / "extraction" / "validators.py", "Validator"),
-        (project_root / "src" / "storage" / "csv_writer.py", "CSV writer"),
-        (project_root / "src" / "storage" / "error_logger.py", "Error logger"),
-        (project_root / "src" / "utils" / "logging_setup.py", "Logging setup"),
-    ]
-
-    for file_path, description in core_files:
+    _p(f"{BOLD}1. Core Source Files{RESET}")
+    for file_path, description in CORE_FILES:
         total_checks += 1
-        if check_file(file_path, description):
+        if check_file(file_path, description, listings):
             checks_passed += 1
 
     # Check configuration files
-    print(f"\n{BOLD}2. Configuration Files{RESET}")
-    config_files = [
-        (project_root / "config" / "config.yaml", "Main configuration"),
-        (project_root / "config" / ".env.example", "Environment template"),
-        (project_root / "requirements.txt", "Python dependencies"),
-    ]
-
-    for file_path, description in config_files:
+    _p(f"\n{BOLD}2. Configuration Files{RESET}")
+    for file_path, description in CONFIG_FILES:
         total_checks += 1
-        if check_file(file_path, description):
+        if check_file(file_path, description, listings):
             checks_passed += 1
 
     # Check .env file specifically
     total_checks += 1
-    env_path = project_root / ".env"
+    env_path = PROJECT_ROOT / ".env"
     env_exists, missing_vars = check_env_file(env_path)
 
     if not env_exists:
-        print(f"  {RED}[X]{RESET} .env file: {env_path}")
-        print(f"    {YELLOW}[!]{RESET}  Create .env file by copying config/.env.example")
+        _p(f"  {RED}[X]{RESET} .env file: {env_path}")
+        _p(f"    {YELLOW}[!]{RESET}  Create .env file by copying config/.env.example")
     elif missing_vars:
-        print(f"  {YELLOW}[!]{RESET}  .env file: {env_path}")
-        print(f"    {YELLOW}[!]{RESET}  Missing or placeholder values for: {', '.join(missing_vars)}")
+        _p(f"  {YELLOW}[!]{RESET}  .env file: {env_path}")
+        _p(f"    {YELLOW}[!]{RESET}  Missing or placeholder values for: {', '.join(missing_vars)}")
         checks_passed += 0.5  # Partial credit
     else:
-        print(f"  {GREEN}[OK]{RESET} .env file: {env_path}")
+        _p(f"  {GREEN}[OK]{RESET} .env file: {env_path}")
         checks_passed += 1
 
     # Check directories
-    print(f"\n{BOLD}3. Directory Structure{RESET}")
-    directories = [
-        (project_root / "src", "Source code"),
-        (project_root / "config", "Configuration"),
-        (project_root / "docs", "Documentation"),
-        (project_root / "tests", "Tests"),
-        (project_root / "output", "Output files (auto-created)"),
-        (project_root / "logs", "Log files (auto-created)"),
-        (project_root / "sessions", "Telegram sessions (auto-created)"),
-    ]
-
-    for dir_path, description in directories:
+    _p(f"\n{BOLD}3. Directory Structure{RESET}")
+    for dir_path, description in DIRECTORIES:
         total_checks += 1
-        if check_directory(dir_path, description):
+        if check_directory(dir_path, description, listings):
             checks_passed += 1
 
     # Check documentation
-    print(f"\n{BOLD}4. Documentation{RESET}")
-    doc_files = [
-        (project_root / "README.md", "User guide"),
-        (project_root / "NEXT_STEPS.md", "Getting started"),
-        (project_root / "BUILD_COMPLETE.md", "Build summary"),
-        (project_root / "TESTING.md", "Testing guide"),
-    ]
-
-    for file_path, description in doc_files:
+    _p(f"\n{BOLD}4. Documentation{RESET}")
+    for file_path, description in DOC_FILES:
         total_checks += 1
-        if check_file(file_path, description):
+        if check_file(file_path, description, listings):
             checks_passed += 1
 
     # Check test files
-    print(f"\n{BOLD}5. Test Files{RESET}")
-    test_files = [
-        (project_root / "tests" / "test_extraction.py", "Extraction tests"),
-        (project_root / "test_extraction.bat", "Test runner (Windows)"),
-    ]
-
-    for file_path, description in test_files:
+    _p(f"\n{BOLD}5. Test Files{RESET}")
+    for file_path, description in TEST_FILES:
         total_checks += 1
-        if check_file(file_path, description):
+        if check_file(file_path, description, listings):
             checks_passed += 1
 
     # Summary
-    print(f"\n{BOLD}{'='*60}{RESET}")
-    print(f"{BOLD}Summary{RESET}")
-    print(f"{BOLD}{'='*60}{RESET}")
+    _p(f"\n{BOLD}{'='*60}{RESET}")
+    _p(f"{BOLD}Summary{RESET}")
+    _p(f"{BOLD}{'='*60}{RESET}")
 
     percentage = (checks_passed / total_checks) * 100
-    print(f"\nChecks passed: {int(checks_passed)}/{total_checks} ({percentage:.1f}%)")
+    _p(f"\nChecks passed: {int(checks_passed)}/{total_checks} ({percentage:.1f}%)")
 
     if percentage == 100:
-        print(f"\n{GREEN}{BOLD}[OK] Setup is complete! You're ready to go.{RESET}")
-        print(f"\n{BOLD}Next steps:{RESET}")
-        print(f"  1. Ensure .env has your Telegram credentials")
-        print(f"  2. Run tests: python tests/test_extraction.py")
-        print(f"  3. Start application: python src/main.py")
-        print(f"\nSee NEXT_STEPS.md for detailed instructions.")
+        _p(f"\n{GREEN}{BOLD}[OK] Setup is complete! You're ready to go.{RESET}")
+        _p(f"\n{BOLD}Next steps:{RESET}")
+        _p(f"  1. Ensure .env has your Telegram credentials")
+        _p(f"  2. Run tests: python tests/test_extraction.py")
+        _p(f"  3. Start application: python src/main.py")
+        _p(f"\nSee NEXT_STEPS.md for detailed instructions.")
     elif percentage >= 80:
-        print(f"\n{YELLOW}{BOLD}[!] Setup is mostly complete, but some items are missing.{RESET}")
-        print(f"\nReview the items marked with {RED}[X]{RESET} or {YELLOW}[!]{RESET} above.")
+        _p(f"\n{YELLOW}{BOLD}[!] Setup is mostly complete, but some items are missing.{RESET}")
+        _p(f"\nReview the items marked with {RED}[X]{RESET} or {YELLOW}[!]{RESET} above.")
     else:
-        print(f"\n{RED}{BOLD}[X] Setup is incomplete. Please review missing items.{RESET}")
-        print(f"\nReview the items marked with {RED}[X]{RESET} above.")
+        _p(f"\n{RED}{BOLD}[X] Setup is incomplete. Please review missing items.{RESET}")
+        _p(f"\nReview the items marked with {RED}[X]{RESET} above.")
 
     # Additional checks
-    print(f"\n{BOLD}Additional Information:{RESET}")
+    _p(f"\n{BOLD}Additional Information:{RESET}")
 
     # Check Python version
     python_version = sys.version_info
     if python_version >= (3, 9):
-        print(f"  {GREEN}[OK]{RESET} Python version: {python_version.major}.{python_version.minor}.{python_version.micro}")
+        _p(f"  {GREEN}[OK]{RESET} Python version: {python_version.major}.{python_version.minor}.{python_version.micro}")
     else:
-        print(f"  {RED}[X]{RESET} Python version: {python_version.major}.{python_version.minor}.{python_version.micro}")
-        print(f"    {YELLOW}[!]{RESET}  Python 3.9+ required")
+        _p(f"  {RED}[X]{RESET} Python version: {python_version.major}.{python_version.minor}.{python_version.micro}")
+        _p(f"    {YELLOW}[!]{RESET}  Python 3.9+ required")
 
     # Check if in virtual environment
     in_venv = hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix)
     if in_venv:
-        print(f"  {GREEN}[OK]{RESET} Virtual environment: Active")
+        _p(f"  {GREEN}[OK]{RESET} Virtual environment: Active")
     else:
-        print(f"  {YELLOW}[!]{RESET}  Virtual environment: Not active")
-        print(f"    {YELLOW}[!]{RESET}  Recommended: Create and activate venv")
+        _p(f"  {YELLOW}[!]{RESET}  Virtual environment: Not active")
+        _p(f"    {YELLOW}[!]{RESET}  Recommended: Create and activate venv")
 
-    print(f"\n{BOLD}{'='*60}{RESET}\n")
+    _p(f"\n{BOLD}{'='*60}{RESET}\n")
+    _flush()
 
 
 if __name__ == "__main__":
     try:
         verify_setup()
     except Exception as e:
+        _flush()
         print(f"\n{RED}Error during verification: {e}{RESET}")
         import traceback
         traceback.print_exc()